@@ -1,14 +1,143 @@
 from PyQt5.QtWidgets import QWidget, QApplication, QVBoxLayout, QPushButton
-from PyQt5.QtCore import Qt, QRectF, QTimer
-from PyQt5.QtGui import (
-    QPainter, QColor, QPen, QBrush,
-    QLinearGradient, QFont, QPainterPath
-)
+from PyQt5.QtCore import Qt, QRectF, QSize, QPointF
+from PyQt5.QtGui import QPainter, QColor, QPen, QPainterPath, QTransform, QPolygonF
+from array import array
+from collections import OrderedDict
+import math
 import sys
 import random
 
+from gauge_base import GaugeGeometry, GaugeWidget
+from gauge_clock import AnimationClock
+
+
+# Liquid surface: two travelling sine waves sampled from one table. Both
+# wrap after WAVE_PHASES steps, so one unit-size profile per phase covers
+# the whole loop and a frame only picks a profile and maps it into place.
+WAVE_PHASES = 64
+WAVE_POINTS = 33
+_SINE = array("d", (math.sin(2 * math.pi * i / 256) for i in range(256)))
+_WAVE_PROFILES = []
+
+
+def wave_profiles():
+    """Per-phase surface polygons, x in 0..1 across the liquid, y in wave amplitudes."""
+    if not _WAVE_PROFILES:
+        for phase in range(WAVE_PHASES):
+            points = [QPointF(k / (WAVE_POINTS - 1),
+                              0.7 * _SINE[(k * 12 + phase * 4) & 255]
+                              + 0.3 * _SINE[(k * 20 - phase * 8) & 255])
+                      for k in range(WAVE_POINTS)]
+            _WAVE_PROFILES.append(QPolygonF(points))
+    return _WAVE_PROFILES
+
+
+class BeakerGeometry(GaugeGeometry):
+    """
+    Paths, chrome pixmaps and label font of a beaker. Shallow liquid shapes,
+    cut to the rounded bottom, are cached here too.
+    """
+
+    DESIGN_WIDTH = 160
+    DESIGN_HEIGHT = 260
+
+    def __init__(self, width, height, dpr, background_color, border_color):
+        super().__init__(width, height, dpr)
+        scale = self.scale
+
+        margin = 20 * scale
+        padding = 6 * scale
+        self.radius = radius = 20 * scale
+
+        self.beaker_rect = QRectF(self.x + margin, self.y + margin, 120 * scale, 180 * scale)
+        self.inner_rect = self.beaker_rect.adjusted(padding, padding, -padding, -padding)
+        self.full_path = self._beaker_path(self.beaker_rect, radius)
+        self.inner_radius = radius - 2 * scale
+        self.fill_path = self._fill_shape(self.inner_rect, self.inner_radius).intersected(self.full_path)
+        self.slab_paths = OrderedDict()
+        # Liquid mode: where a surface can be drawn without clipping
+        self.liquid_floor = self._floor_outline(self.inner_rect, self.inner_radius)
+        self.wall_top = self.inner_rect.top()
+        self.wall_bottom = self.inner_rect.bottom() - self.inner_radius
+        self._label(self.beaker_rect.bottom())
+        self.spark_rect = QRectF(self.beaker_rect.left(), self.text_rect.bottom() + 2 * scale,
+                                 self.beaker_rect.width(), 22 * scale)
+
+        def background(painter):
+            painter.setBrush(background_color)
+            painter.setPen(Qt.NoPen)
+            painter.drawPath(self.full_path)
+
+        def border(painter):
+            painter.setPen(QPen(border_color, 2 * scale))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPath(self.full_path)
+
+        self.background_layer = self._layer(background)
+        self.border_layer = self._layer(border)
+
+    def slab_path(self, fill_top):
+        """Flat liquid below fill_top cut to the beaker, once per quarter device pixel."""
+        key = round(fill_top * self.dpr * 4)
+        path = self.slab_paths.get(key)
+        if path is not None:
+            self.slab_paths.move_to_end(key)
+            return path
+
+        inner_rect = self.inner_rect
+        path = QPainterPath()
+        path.addRect(QRectF(inner_rect.left(), fill_top, inner_rect.width(), inner_rect.bottom() - fill_top))
+        path = path.intersected(self.full_path)
+
+        self.slab_paths[key] = path
+        if len(self.slab_paths) > 256:
+            self.slab_paths.popitem(last=False)
+        return path
+
+    @staticmethod
+    def _beaker_path(rect, radius):
+        # Beaker shape with rounded top and rounded bottom
+        left, right, top, bottom = rect.left(), rect.right(), rect.top(), rect.bottom()
+        path = QPainterPath()
+        path.moveTo(left + radius, top)
+        path.lineTo(right - radius, top)
+        path.quadTo(right, top, right, top + radius)
+        path.lineTo(right, bottom - radius)
+        path.quadTo(right, bottom, right - radius, bottom)
+        path.lineTo(left + radius, bottom)
+        path.quadTo(left, bottom, left, bottom - radius)
+        path.lineTo(left, top + radius)
+        path.quadTo(left, top, left + radius, top)
+        return path
+
+    @staticmethod
+    def _floor_outline(rect, radius):
+        # Flattened rounded bottom of the fill column, right side to left side,
+        # for closing a liquid surface polygon
+        path = QPainterPath()
+        path.moveTo(rect.right(), rect.bottom() - radius)
+        path.quadTo(rect.right(), rect.bottom(), rect.right() - radius, rect.bottom())
+        path.lineTo(rect.left() + radius, rect.bottom())
+        path.quadTo(rect.left(), rect.bottom(), rect.left(), rect.bottom() - radius)
+        return path.toSubpathPolygons()[0]
+
+    @staticmethod
+    def _fill_shape(rect, radius):
+        # Fill column at full height, rounded at the bottom only
+        path = QPainterPath()
+        path.moveTo(rect.left(), rect.top())
+        path.lineTo(rect.right(), rect.top())
+        path.lineTo(rect.right(), rect.bottom() - radius)
+        path.quadTo(rect.right(), rect.bottom(), rect.right() - radius, rect.bottom())
+        path.lineTo(rect.left() + radius, rect.bottom())
+        path.quadTo(rect.left(), rect.bottom(), rect.left(), rect.bottom() - radius)
+        path.lineTo(rect.left(), rect.top())
+        return path
+
+
+class BeakerWidget(GaugeWidget):
+    geometry_class = BeakerGeometry
 
-class BeakerWidget(QWidget):
     def __init__(
         self,
         fill_color=QColor("#3498db"),
@@ -16,133 +145,161 @@ class BeakerWidget(QWidget):
         border_color=QColor("#888"),
         parent=None
     ):
-        super().__init__(parent)
-
-        self._fill_color = fill_color
-        self._background_color = background_color
-        self._border_color = border_color
-
-        self._current_percent = 0
-        self._target_percent = 0
-        self._animation_step = 1
-
-        self._beaker_width = 120
-        self._beaker_height = 180
-        self.setFixedSize(self._beaker_width + 40, self._beaker_height + 80)
-
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self.animate_fill)
+        super().__init__(fill_color, background_color, border_color, parent)
 
-        self.setStyleSheet("background-color: #1e1e1e;")
+        # Optional waving liquid surface
+        self._liquid = False
+        self._wave_amplitude = 3
+        self._wave_speed = 0.8
+        self._wave_running = False
+        self._slosh = 0
+        self._slosh_start = 0
 
     def setFillPercent(self, percent: int):
         """Animate to a new percentage."""
-        self._target_percent = max(0, min(100, percent))
-        if not self._timer.isActive():
-            self._timer.start(10)
+        percent = max(0, min(100, percent))
+        if self._liquid and percent != self._target_percent:
+            # Kick the surface toward the direction of travel
+            self._slosh = math.copysign(min(abs(percent - self._current_percent), 30) / 30,
+                                        percent - self._current_percent)
+            self._slosh_start = AnimationClock.instance().now()
+        super().setFillPercent(percent)
+
+    def setLiquidMode(self, enabled=True, amplitude=3, speed=0.8):
+        """Wave the liquid surface (amplitude in unscaled pixels, speed in loops per second)."""
+        self._liquid = enabled
+        self._wave_amplitude = amplitude
+        self._wave_speed = speed
+        if enabled:
+            self._start_wave()
+        else:
+            AnimationClock.instance().unsubscribe(self._wave_tick)
+            self._wave_running = False
+        self.update()
 
     def setFillColorAndAnimate(self, color: QColor):
         """Change the fill color but keep the current percentage."""
         self._fill_color = color
         self._target_percent = self._current_percent  # Keep the same percent
         self._current_percent = 0
-        if not self._timer.isActive():
-            self._timer.start(10)
+        self._start_animation()
         self.update()
 
-    def animate_fill(self):
-        if self._current_percent < self._target_percent:
-            self._current_percent += self._animation_step
-        elif self._current_percent > self._target_percent:
-            self._current_percent -= self._animation_step
-        else:
-            self._timer.stop()
+    def _start_wave(self):
+        if self._liquid and not self._wave_running and self.isVisible():
+            self._wave_running = True
+            AnimationClock.instance().subscribe(self._wave_tick)
+
+    def _wave_tick(self, now):
+        # Pause while nothing of the widget can be seen; the next expose
+        # (paintEvent) or showEvent resumes
+        if (not self._liquid or not self.isVisible() or self.window().isMinimized()
+                or self.visibleRegion().isEmpty()):
+            self._wave_running = False
+            return False
         self.update()
+        return True
+
+    def _wave_shape(self, now, scale):
+        """Current surface amplitude and left-to-right tilt, in pixels."""
+        travel = self._target_percent - self._current_percent
+        amplitude = self._wave_amplitude * scale
+        if travel:
+            amplitude += min(abs(travel), 20) * 0.1 * scale
+        tilt = 0
+        if self._slosh:
+            elapsed = now - self._slosh_start
+            if elapsed < 3000:
+                tilt = self._slosh * 14 * scale * math.exp(-elapsed / 600) * math.sin(elapsed * 0.012)
+            else:
+                self._slosh = 0
+        return amplitude, tilt
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._start_wave()
+
+    def minimumSizeHint(self):
+        return QSize(40, 65)
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        margin = 20
-        padding = 6
-        radius = 20
-
-        beaker_rect = QRectF(margin, margin, self._beaker_width, self._beaker_height)
-        left = beaker_rect.left()
-        right = beaker_rect.right()
-        top = beaker_rect.top()
-        bottom = beaker_rect.bottom()
-
-        # Create beaker shape with rounded top and rounded bottom
-        beaker_path = QPainterPath()
-        beaker_path.moveTo(left + radius, top)
-        beaker_path.lineTo(right - radius, top)
-        beaker_path.quadTo(right, top, right, top + radius)
-        beaker_path.lineTo(right, bottom - radius)
-        beaker_path.quadTo(right, bottom, right - radius, bottom)
-        beaker_path.lineTo(left + radius, bottom)
-        beaker_path.quadTo(left, bottom, left, bottom - radius)
-        beaker_path.lineTo(left, top + radius)
-        beaker_path.quadTo(left, top, left + radius, top)
-
-        # Draw beaker background
-        painter.setBrush(self._background_color)
-        painter.setPen(Qt.NoPen)
-        painter.drawPath(beaker_path)
-
-        # Calculate fill level
-        inner_rect = beaker_rect.adjusted(padding, padding, -padding, -padding)
-        inner_radius = radius - 2
-        fill_height = inner_rect.height() * (self._current_percent / 100.0)
-        fill_top = inner_rect.bottom() - fill_height
+        if self._liquid and not self._wave_running:
+            self._start_wave()
+        super().paintEvent(event)
 
-        # Fill path (with rounded bottom)
-        fill_path = QPainterPath()
-        if self._current_percent >= 98:
-            fill_path = beaker_path  # Use full shape if nearly full
-        else:
-            fill_rect = QRectF(inner_rect.left(), fill_top, inner_rect.width(), fill_height)
-            if fill_height > inner_radius:
-                # Rounded bottom corners for fill
-                fill_path.moveTo(fill_rect.left(), fill_rect.top())
-                fill_path.lineTo(fill_rect.right(), fill_rect.top())
-                fill_path.lineTo(fill_rect.right(), fill_rect.bottom() - inner_radius)
-                fill_path.quadTo(
-                    fill_rect.right(), fill_rect.bottom(),
-                    fill_rect.right() - inner_radius, fill_rect.bottom()
-                )
-                fill_path.lineTo(fill_rect.left() + inner_radius, fill_rect.bottom())
-                fill_path.quadTo(
-                    fill_rect.left(), fill_rect.bottom(),
-                    fill_rect.left(), fill_rect.bottom() - inner_radius
-                )
-                fill_path.lineTo(fill_rect.left(), fill_rect.top())
-            else:
-                fill_path.addRect(fill_rect)
+    def _paint_liquid(self, painter, geometry, fill_top):
+        now = AnimationClock.instance().now()
+        amplitude, tilt = self._wave_shape(now, geometry.scale)
+        reach = amplitude + abs(tilt) / 2
+        inner_rect = geometry.inner_rect
 
-        # Fill gradient
-        if fill_height > 1:
-            gradient = QLinearGradient(0, fill_top, 0, beaker_rect.bottom())
-            gradient.setColorAt(0.0, self._fill_color.lighter(120))
-            gradient.setColorAt(1.0, self._fill_color.darker(130))
+        # Surface: this phase's profile scaled by the amplitude and sheared
+        # by the slosh tilt
+        phase = int(now * self._wave_speed * WAVE_PHASES / 1000) % WAVE_PHASES
+        placement = QTransform(inner_rect.width(), tilt, 0, amplitude, inner_rect.left(), fill_top - tilt / 2)
+        surface = placement.map(_WAVE_PROFILES[phase] if _WAVE_PROFILES else wave_profiles()[phase])
+
+        if geometry.wall_top <= fill_top - reach - 1 and fill_top + reach + 1 <= geometry.wall_bottom:
+            # The surface stays within the straight walls: the wave closed by
+            # the cached floor outline is the whole liquid, no clipping needed
+            painter.drawPolygon(surface + geometry.liquid_floor)
+            return
+
+        # Near the rounded ends: the cached fill shape below the lowest
+        # trough, then the surface band, both clipped to the fill shape
+        band = QRectF(inner_rect.left(), fill_top - reach - 1, inner_rect.width(), 2 * reach + 2)
+        painter.setClipRect(QRectF(0, band.bottom() - 1, geometry.width, geometry.height))
+        painter.drawPath(geometry.fill_path)
+        painter.setClipRect(band)
+        painter.setClipPath(geometry.fill_path, Qt.IntersectClip)
+        painter.drawPolygon(surface + QPolygonF([band.bottomRight(), band.bottomLeft()]))
 
-            painter.setBrush(QBrush(gradient))
+    def paint_gauge(self, painter, percent, dpr):
+        """Draw the gauge at percent, origin at its top-left. GaugeWall paints through this too."""
+        geometry = self._ensure_geometry(dpr)
+        self._ensure_fill_brush()
+        painter.drawPixmap(0, 0, geometry.background_layer)
+
+        # Liquid: the cached fill shape clipped to the current level
+        inner_rect = geometry.inner_rect
+        fill_height = inner_rect.height() * (percent / 100.0)
+        fill_top = inner_rect.bottom() - fill_height
+        if fill_height > 1:
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._fill_brush.setTransform(
+                QTransform.fromTranslate(0, fill_top).scale(1, geometry.beaker_rect.bottom() - fill_top))
+            painter.setBrush(self._fill_brush)
             painter.setPen(Qt.NoPen)
-            painter.drawPath(fill_path.intersected(beaker_path))
+            if self._liquid:
+                self._paint_liquid(painter, geometry, fill_top)
+                painter.setClipping(False)
+            elif percent >= 98:
+                # Use full shape if nearly full
+                painter.drawPath(geometry.full_path)
+            elif fill_height > geometry.inner_radius:
+                # Clip rects are not antialiased, so the cached shape is cut at
+                # the next pixel row and the partly covered row above it is
+                # drawn as a thin rect, keeping the level's soft edge
+                row = math.ceil(fill_top * dpr) / dpr
+                painter.setClipRect(QRectF(0, row, geometry.width, geometry.height - row))
+                painter.drawPath(geometry.fill_path)
+                painter.setClipping(False)
+                if row > fill_top:
+                    painter.drawRect(QRectF(inner_rect.left(), fill_top, inner_rect.width(), row - fill_top))
+            else:
+                # Too shallow for the rounded corners: a flat slab cut to the beaker
+                painter.drawPath(geometry.slab_path(fill_top))
 
-        # Draw beaker border
-        painter.setPen(QPen(self._border_color, 2))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawPath(beaker_path)
+        painter.drawPixmap(0, 0, geometry.border_layer)
 
         # Percentage text
-        painter.setPen(QColor("#ffffff"))
-        font = QFont("Arial", 10)
-        font.setBold(True)
-        painter.setFont(font)
-        text = f"{int(self._current_percent)}%"
-        text_rect = QRectF(0, bottom + 8, self.width(), 20)
-        painter.drawText(text_rect, Qt.AlignHCenter | Qt.AlignTop, text)
+        painter.setPen(self._text_color)
+        painter.setFont(geometry.font)
+        painter.drawText(geometry.text_rect, Qt.AlignHCenter | Qt.AlignTop, f"{int(percent)}%")
+
+        if self._history is not None:
+            self._history.draw(painter, geometry.spark_rect, self._history_pen,
+                               self._history_brush if self._history_band else None)
 
 
 # --- Demo usage ---
@@ -156,7 +313,7 @@ if __name__ == "__main__":
         background_color=QColor("#fff"),
         border_color=QColor("#ccc")
     )
-    layout.addWidget(beaker, alignment=Qt.AlignCenter)
+    layout.addWidget(beaker, 1)
 
     # Button to change fill percentage
     button = QPushButton("Random Fill")
@@ -170,6 +327,11 @@ if __name__ == "__main__":
     ))
     layout.addWidget(color_button, alignment=Qt.AlignCenter)
 
+    liquid_button = QPushButton("Liquid Mode")
+    liquid_button.setCheckable(True)
+    liquid_button.toggled.connect(beaker.setLiquidMode)
+    layout.addWidget(liquid_button, alignment=Qt.AlignCenter)
+
     window.setStyleSheet("background-color: #6BAED6; color: white;")
     window.setWindowTitle("Beaker Widget - Keep % on Color Change")
     window.show()
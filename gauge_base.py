@@ -0,0 +1,171 @@
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, QRectF, QSize
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QLinearGradient, QFont, QPixmap
+
+from gauge_clock import AnimationClock, FillAnimation
+from gauge_history import LevelHistory
+
+
+class GaugeGeometry:
+    """
+    Layout of a gauge scaled from its design size into a given size, at a
+    given device pixel ratio and colors. Subclasses build their paths and
+    chrome layers on top of it. Each subclass keeps its own small LRU of
+    instances, so equal-sized gauges build them once and a widget moving
+    between screens does not rebuild on each switch.
+    """
+
+    # Layout of the original fixed-size widget, scaled to fit
+    DESIGN_WIDTH = 100
+    DESIGN_HEIGHT = 100
+    cache_size = 32
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cache = OrderedDict()
+
+    @classmethod
+    def get(cls, width, height, dpr, background_color, border_color):
+        key = (width, height, dpr, background_color.rgba(), border_color.rgba())
+        geometry = cls._cache.get(key)
+        if geometry is None:
+            geometry = cls._cache[key] = cls(width, height, dpr, background_color, border_color)
+            if len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+        return geometry
+
+    def __init__(self, width, height, dpr):
+        self.width = width
+        self.height = height
+        self.dpr = dpr
+        self.scale = min(width / self.DESIGN_WIDTH, height / self.DESIGN_HEIGHT)
+        # Top-left of the design area, centered in the actual size
+        self.x = (width - self.DESIGN_WIDTH * self.scale) / 2
+        self.y = (height - self.DESIGN_HEIGHT * self.scale) / 2
+
+    def _label(self, body_bottom):
+        """Percentage label font and rect, just under the gauge body."""
+        scale = self.scale
+        self.text_rect = QRectF(0, body_bottom + 8 * scale, self.width, 20 * scale)
+        self.font = QFont("Arial")
+        self.font.setPointSizeF(max(10 * scale, 1))
+        self.font.setBold(True)
+
+    def _layer(self, draw):
+        pixmap = QPixmap(round(self.width * self.dpr), round(self.height * self.dpr))
+        pixmap.setDevicePixelRatio(self.dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        draw(painter)
+        painter.end()
+        return pixmap
+
+
+class GaugeWidget(QWidget):
+    """
+    Base of BeakerWidget and TestTubeWidget: fill animation on the shared
+    clock, geometry looked up again only when size, DPR or colors change,
+    the fill gradient and the optional level sparkline. Subclasses set
+    geometry_class and implement paint_gauge(), which GaugeWall also paints
+    through.
+    """
+
+    geometry_class = GaugeGeometry
+    gradient_lighter = 120
+    gradient_darker = 130
+
+    def __init__(self, fill_color, background_color, border_color, parent=None):
+        super().__init__(parent)
+
+        self._fill_color = fill_color
+        self._background_color = background_color
+        self._border_color = border_color
+
+        self._current_percent = 0
+        self._target_percent = 0
+        self._animation = FillAnimation()
+
+        # Laid out against the actual size; the design size is only preferred
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+
+        self._geometry_key = None
+        self._geometry = None
+        self._fill_brush_key = None
+        self._text_color = QColor("#ffffff")
+
+        # Optional level history, drawn as a sparkline under the label
+        self._history = None
+        self._history_band = False
+
+        self.setStyleSheet("background-color: #1e1e1e;")
+
+    def setFillPercent(self, percent):
+        """Animate to a new percentage."""
+        self._target_percent = max(0, min(100, percent))
+        if self._history is not None:
+            self._history.append(AnimationClock.instance().now(), self._target_percent)
+        self._start_animation()
+
+    def setTextColor(self, color):
+        """Color of the percentage label; the default white suits dark backgrounds."""
+        self._text_color = QColor(color)
+        self.update()
+
+    def setHistoryEnabled(self, enabled=True, capacity=120, band=False):
+        """Keep the last `capacity` levels and draw them as a sparkline, optionally with a min/max band."""
+        self._history = LevelHistory(capacity) if enabled else None
+        self._history_band = band
+        self.update()
+
+    def history(self):
+        return self._history
+
+    def _start_animation(self):
+        clock = AnimationClock.instance()
+        self._animation.retarget(self._current_percent, self._target_percent, clock.now())
+        clock.subscribe(self.animate_fill)
+
+    def animate_fill(self, now):
+        """Advance to the shared clock's time; False once the target is reached."""
+        self._current_percent = self._animation.value(now)
+        self.update()
+        return self._animation.running(now)
+
+    def sizeHint(self):
+        return QSize(self.geometry_class.DESIGN_WIDTH, self.geometry_class.DESIGN_HEIGHT)
+
+    def _ensure_geometry(self, dpr):
+        key = (self.width(), self.height(), dpr,
+               self._background_color.rgba(), self._border_color.rgba())
+        if key != self._geometry_key:
+            self._geometry_key = key
+            self._geometry = self.geometry_class.get(self.width(), self.height(), dpr,
+                                                     self._background_color, self._border_color)
+        return self._geometry
+
+    def _ensure_fill_brush(self):
+        if self._fill_brush_key == self._fill_color.rgba():
+            return
+        self._fill_brush_key = self._fill_color.rgba()
+        # Unit-height gradient, stretched over the liquid with the brush transform
+        gradient = QLinearGradient(0, 0, 0, 1)
+        gradient.setColorAt(0.0, self._fill_color.lighter(self.gradient_lighter))
+        gradient.setColorAt(1.0, self._fill_color.darker(self.gradient_darker))
+        self._fill_brush = QBrush(gradient)
+        self._history_pen = QPen(self._fill_color.lighter(120), 1.5)
+        self._history_pen.setCosmetic(True)
+        band = QColor(self._fill_color)
+        band.setAlpha(60)
+        self._history_brush = QBrush(band)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self.paint_gauge(painter, self._current_percent, self.devicePixelRatioF())
+
+    def paint_gauge(self, painter, percent, dpr):
+        raise NotImplementedError
@@ -0,0 +1,68 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QImage, QPainter, QColor
+
+from beaker_widget import BeakerWidget
+from progress_bar import TestTubeWidget
+
+
+def paint_times(cases, frames, dpr=1):
+    """
+    Median milliseconds to paint every gauge of each case once through
+    paint_gauge(). Cases take turns frame by frame, so a noisy machine
+    slows them alike.
+    """
+    size = max((gauges[0].size() for gauges in cases.values()), key=lambda s: s.width() * s.height())
+    image = QImage(round(size.width() * dpr), round(size.height() * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    times = {name: [] for name in cases}
+    for _ in range(frames):
+        for name, gauges in cases.items():
+            start = time.perf_counter()
+            for gauge in gauges:
+                painter = QPainter(image)
+                gauge.paint_gauge(painter, gauge._current_percent, dpr)
+                painter.end()
+            times[name].append((time.perf_counter() - start) * 1000)
+    return {name: sorted(values)[len(values) // 2] for name, values in times.items()}
+
+
+def make_gauges(cls, count, liquid=False):
+    gauges = []
+    for _ in range(count):
+        gauge = cls(fill_color=QColor(random.choice(["#FFAA5C", "#4CAF50", "#3498DB"])))
+        gauge.resize(gauge.sizeHint())
+        gauge._current_percent = gauge._target_percent = random.uniform(5, 95)
+        if liquid:
+            gauge.setLiquidMode(True)
+        gauges.append(gauge)
+    return gauges
+
+
+# --- Paint cost per frame, offscreen ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time gauge painting per frame.")
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--dpr", type=float, default=1)
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication(sys.argv)
+    random.seed(1)
+
+    cases = {
+        "beaker": make_gauges(BeakerWidget, args.count),
+        "beaker, liquid mode": make_gauges(BeakerWidget, args.count, liquid=True),
+        "test tube": make_gauges(TestTubeWidget, args.count),
+    }
+    paint_times(cases, 10, args.dpr)   # warm the geometry caches
+    results = paint_times(cases, args.frames, args.dpr)
+    for name, ms in results.items():
+        print(f"{name:<22}{ms:7.2f} ms per frame for {args.count}")
+    print(f"{'liquid mode extra':<22}{results['beaker, liquid mode'] - results['beaker']:7.2f} ms")
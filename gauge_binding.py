@@ -0,0 +1,158 @@
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from gauge_clock import AnimationClock
+
+
+class _Channel:
+    __slots__ = ("target", "index", "mode", "count", "latest", "low", "high", "total",
+                 "ingested", "rendered", "last_value")
+
+    def __init__(self, target, index, mode):
+        self.target = target
+        self.index = index
+        self.mode = mode
+        self.ingested = 0
+        self.rendered = 0
+        self.last_value = None
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.latest = None
+        self.low = None
+        self.high = None
+        self.total = 0.0
+
+    def add(self, value):
+        self.count += 1
+        self.ingested += 1
+        self.latest = value
+        self.low = value if self.low is None or value < self.low else self.low
+        self.high = value if self.high is None or value > self.high else self.high
+        self.total += value
+
+    def reduce(self):
+        if self.mode == "min":
+            return self.low
+        if self.mode == "max":
+            return self.high
+        if self.mode == "mean":
+            return self.total / self.count
+        return self.latest
+
+
+class TelemetryBinding(QObject):
+    """
+    Feeds sensor samples into gauges at display rate.
+
+    push() may be called from any thread and at any rate; samples are folded
+    into their channel (latest value, or min/max/mean of the frame) under a
+    lock. The first sample after an idle period wakes the GUI thread, which
+    applies each channel's reduced value at the shared AnimationClock's next
+    frame, so a gauge is retargeted at most once per frame however fast its
+    sensor is. Targets are BeakerWidget/TestTubeWidget (setFillPercent) or a
+    GaugeWall gauge (set_level). Samples for unknown or unbound channels,
+    e.g. of a gauge that was deleted, are counted as dropped.
+    """
+
+    MODES = ("latest", "min", "max", "mean")
+    _wake = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._channels = {}
+        self._dirty = set()
+        self._next_id = 0
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self._wake.connect(self._schedule)
+        self.frames = 0
+        self.dropped = 0
+
+    # Public API
+    def bind(self, target, index=None, mode="latest"):
+        """Register a gauge (or GaugeWall and gauge index) and return its channel id."""
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, not {mode!r}")
+        with self._lock:
+            channel = self._next_id
+            self._next_id += 1
+            self._channels[channel] = _Channel(target, index, mode)
+        return channel
+
+    def unbind(self, channel):
+        with self._lock:
+            self._channels.pop(channel, None)
+            self._dirty.discard(channel)
+
+    def push(self, channel, value):
+        """Record one sample; thread-safe."""
+        with self._lock:
+            state = self._channels.get(channel)
+            if state is None:
+                self.dropped += 1
+                return
+            state.add(value)
+            self._dirty.add(channel)
+            wake = not self._scheduled
+            self._scheduled = True
+        if wake:
+            self._wake.emit()
+
+    def push_many(self, channel, values):
+        with self._lock:
+            state = self._channels.get(channel)
+            if state is None:
+                self.dropped += sum(1 for _ in values)
+                return
+            for value in values:
+                state.add(value)
+            if state.count:
+                self._dirty.add(channel)
+            wake = bool(state.count) and not self._scheduled
+            self._scheduled = self._scheduled or wake
+        if wake:
+            self._wake.emit()
+
+    def stats(self, channel=None):
+        """Samples ingested versus values actually applied to gauges."""
+        with self._lock:
+            channels = [self._channels[channel]] if channel is not None else self._channels.values()
+            ingested = sum(state.ingested for state in channels)
+            rendered = sum(state.rendered for state in channels)
+        return {"ingested": ingested, "rendered": rendered, "coalesced": ingested - rendered,
+                "dropped": self.dropped, "frames": self.frames}
+
+    # Frame handling
+    def _schedule(self):
+        AnimationClock.instance().subscribe(self._apply)
+
+    def _apply(self, now):
+        with self._lock:
+            updates = []
+            for channel in self._dirty:
+                state = self._channels[channel]
+                updates.append((channel, state, state.reduce()))
+                state.reset()
+            self._dirty.clear()
+            self._scheduled = False
+
+        self.frames += 1
+        for channel, state, value in updates:
+            if value == state.last_value:
+                continue
+            try:
+                if state.index is None:
+                    state.target.setFillPercent(value)
+                else:
+                    state.target.set_level(state.index, value)
+            except RuntimeError:
+                # The gauge was deleted
+                self.unbind(channel)
+                continue
+            state.last_value = value
+            state.rendered += 1
+        # Stay off the clock until the next sample arrives
+        return False
@@ -0,0 +1,103 @@
+from PyQt5.QtCore import Qt, QObject, QTimer, QElapsedTimer, QEasingCurve
+from PyQt5.QtGui import QGuiApplication
+
+
+class AnimationClock(QObject):
+    """
+    One frame timer shared by every gauge in the process.
+
+    Subscribers are callables taking the current time in milliseconds and
+    returning True while they still have work to do; they are called once
+    per display frame and dropped as soon as they return False (or their
+    widget has been deleted). The timer only runs while someone is
+    subscribed, so a dashboard of idle gauges costs no wakeups at all.
+    """
+
+    _instance = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._subscribers = {}   # dict keeps subscription order
+        self.frames = 0
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(self.frame_interval())
+        self._timer.timeout.connect(self._tick)
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(QGuiApplication.instance())
+        return cls._instance
+
+    @staticmethod
+    def frame_interval():
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen is not None else 0
+        return max(1, round(1000 / (rate if rate > 1 else 60)))
+
+    def now(self):
+        return self._elapsed.elapsed()
+
+    def subscribe(self, callback):
+        self._subscribers[callback] = None
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unsubscribe(self, callback):
+        self._subscribers.pop(callback, None)
+
+    def is_subscribed(self, callback):
+        return callback in self._subscribers
+
+    def active_count(self):
+        return len(self._subscribers)
+
+    def _tick(self):
+        self.frames += 1
+        now = self.now()
+        for callback in list(self._subscribers):
+            try:
+                busy = callback(now)
+            except RuntimeError:
+                # The widget behind the callback was deleted
+                busy = False
+            if not busy:
+                self._subscribers.pop(callback, None)
+        if not self._subscribers:
+            self._timer.stop()
+
+
+class FillAnimation:
+    """
+    Time-based ease from one fill level to another. The duration grows with
+    the distance travelled (ms_per_percent, capped at max_duration), so the
+    speed no longer depends on how often the timer manages to fire.
+    """
+
+    def __init__(self, ms_per_percent=10, max_duration=800, easing=QEasingCurve.OutCubic):
+        self.ms_per_percent = ms_per_percent
+        self.max_duration = max_duration
+        self.easing = QEasingCurve(easing)
+        self.start_value = 0
+        self.end_value = 0
+        self.start_time = 0
+        self.duration = 0
+
+    def retarget(self, current, target, now):
+        self.start_value = current
+        self.end_value = target
+        self.start_time = now
+        self.duration = min(abs(target - current) * self.ms_per_percent, self.max_duration)
+
+    def value(self, now):
+        if not self.running(now):
+            return self.end_value
+        progress = self.easing.valueForProgress((now - self.start_time) / self.duration)
+        return self.start_value + (self.end_value - self.start_value) * progress
+
+    def running(self, now):
+        return now - self.start_time < self.duration
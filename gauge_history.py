@@ -0,0 +1,99 @@
+from array import array
+
+from PyQt5.QtCore import QPointF, QRectF
+from PyQt5.QtGui import QPolygonF, QTransform
+
+
+class LevelHistory:
+    """
+    Fixed-capacity ring of (timestamp, level) samples for a gauge sparkline.
+
+    Timestamps and levels live in preallocated arrays, so appending never
+    allocates and memory stays flat however long a dashboard runs. The
+    sparkline is one QPolygonF of at most `capacity` points, oldest sample
+    first, with each point's x its sample number: a frame appends only the
+    samples that arrived since the previous one and drops as many from the
+    front, and draw() shifts x back into place, so points already in the
+    polygon are never rewritten.
+    """
+
+    def __init__(self, capacity=120):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.levels = array("d", bytes(8 * capacity))
+        self._head = 0        # next slot to write
+        self._count = 0
+        self._unsynced = 0    # samples not yet copied into the polyline
+        self._appended = 0    # samples ever appended, numbers the polyline's x
+        self._polyline = QPolygonF()
+
+    def __len__(self):
+        return self._count
+
+    def append(self, timestamp, level):
+        head = self._head
+        self.times[head] = timestamp
+        self.levels[head] = level
+        self._head = (head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self._unsynced = min(self._unsynced + 1, self.capacity)
+        self._appended += 1
+
+    def clear(self):
+        self._head = self._count = self._unsynced = self._appended = 0
+        self._polyline.clear()
+
+    def samples(self):
+        """(times, levels) arrays in chronological order; copies, for export."""
+        start = (self._head - self._count) % self.capacity
+        order = [(start + i) % self.capacity for i in range(self._count)]
+        return array("d", (self.times[i] for i in order)), array("d", (self.levels[i] for i in order))
+
+    def level_range(self):
+        """(lowest, highest) level currently held, or None when empty."""
+        if not self._count:
+            return None
+        levels = memoryview(self.levels)[:self._count]
+        return min(levels), max(levels)
+
+    def polyline(self):
+        """
+        Sparkline points oldest to newest, x = sample number (offset() for the
+        first point), y = level. The polygon is live and updated in place by
+        the next call; copy it to keep it.
+        """
+        new = self._unsynced
+        if new:
+            self._unsynced = 0
+            capacity = self.capacity
+            polyline = self._polyline
+            # The new samples sit just behind the ring's head, maybe wrapped
+            number = self._appended - new
+            for offset in range(new):
+                polyline.append(QPointF(number + offset, self.levels[(self._head - new + offset) % capacity]))
+            if polyline.size() > capacity:
+                polyline.remove(0, polyline.size() - capacity)
+        return self._polyline
+
+    def offset(self):
+        """Sample number of the polyline's first point."""
+        return self._appended - self._count
+
+    def draw(self, painter, rect, pen, band_brush=None):
+        """Draw the sparkline into rect (levels 0-100 bottom to top), with an optional min/max band."""
+        if self._count < 2:
+            return
+        painter.save()
+        # Newest sample at the right edge, older ones to its left
+        x_scale = rect.width() / (self.capacity - 1)
+        first = self.capacity - self._count
+        painter.setTransform(QTransform(x_scale, 0, 0, -rect.height() / 100,
+                                        rect.left() + x_scale * (first - self.offset()), rect.bottom()), True)
+        if band_brush is not None:
+            low, high = self.level_range()
+            painter.fillRect(QRectF(self.offset(), low, self._count - 1, high - low), band_brush)
+        painter.setPen(pen)
+        painter.drawPolyline(self.polyline())
+        painter.restore()
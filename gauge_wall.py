@@ -0,0 +1,247 @@
+from array import array
+from itertools import compress, repeat
+from operator import ne
+import math
+import random
+import sys
+
+from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtCore import QRect, QTimer, QEasingCurve
+from PyQt5.QtGui import QPainter, QColor
+
+from beaker_widget import BeakerWidget
+from progress_bar import TestTubeWidget
+from gauge_clock import AnimationClock
+
+
+class GaugeWall(QWidget):
+    """
+    Many beaker/test-tube gauges drawn by a single widget.
+
+    Levels, animation state and fill colors live in flat arrays, one slot
+    per gauge. Drawing goes through one hidden BeakerWidget/TestTubeWidget per
+    kind, recolored for each gauge it paints, so the wall looks exactly like
+    the standalone widgets and shares their cached paths and pixmaps. Only
+    the cells of gauges whose level moved are invalidated, and paintEvent
+    only draws the gauges inside the dirty region, grouped by fill color so
+    the fill brush is rebuilt once per color.
+    """
+
+    KINDS = {"beaker": BeakerWidget, "tube": TestTubeWidget}
+
+    def __init__(
+        self,
+        count=0,
+        kind="beaker",
+        columns=20,
+        fill_color=QColor("#3498db"),
+        background_color=QColor("#111"),
+        border_color=QColor("#888"),
+        parent=None
+    ):
+        super().__init__(parent)
+        self._kind_names = list(self.KINDS)
+        self._background_color = background_color
+        self._border_color = border_color
+        self._wall_color = QColor("#1e1e1e")
+        self._columns = columns
+
+        # One slot per gauge
+        self._kinds = array("b")
+        self._fill = array("I")          # fill color as QRgb
+        self._current = array("d")
+        self._start = array("d")
+        self._target = array("d")
+        self._start_time = array("d")
+        self._duration = array("d")
+        self._animating = set()
+
+        # Same timing as FillAnimation
+        self.ms_per_percent = 10
+        self.max_duration = 800
+        self._easing = QEasingCurve(QEasingCurve.OutCubic)
+
+        self._prototypes = {}
+        self._cell_width = 0
+        self._cell_height = 0
+        self.painted_gauges = 0   # gauges drawn in the last paintEvent
+
+        for _ in range(count):
+            self.add_gauge(kind, fill_color)
+
+    # Public API
+    def count(self):
+        return len(self._current)
+
+    def add_gauge(self, kind="beaker", fill_color=QColor("#3498db")):
+        """Append a gauge at 0% and return its index."""
+        if kind not in self.KINDS:
+            raise ValueError(f"unknown gauge kind {kind!r}")
+        index = len(self._current)
+        self._kinds.append(self._kind_names.index(kind))
+        self._fill.append(QColor(fill_color).rgba())
+        for values in (self._current, self._start, self._target, self._start_time, self._duration):
+            values.append(0)
+
+        prototype = self._prototype(kind)
+        if prototype.width() > self._cell_width or prototype.height() > self._cell_height:
+            self._cell_width = max(self._cell_width, prototype.width())
+            self._cell_height = max(self._cell_height, prototype.height())
+        self._update_size()
+        self.update(self.cell_rect(index))
+        return index
+
+    def set_levels(self, levels):
+        """Retarget every gauge from one sequence (list, array or NumPy array) of percents."""
+        if hasattr(levels, "tolist"):
+            levels = levels.tolist()
+        if len(levels) != len(self._target):
+            raise ValueError(f"expected {len(self._target)} levels, got {len(levels)}")
+        # Clamp and compare whole sequences with C-level iterators; only the
+        # gauges whose target moved are visited from Python
+        levels = array("d", map(min, repeat(100), map(max, repeat(0), levels)))
+        if levels == self._target:
+            return
+        now = AnimationClock.instance().now()
+        for index in compress(range(len(levels)), map(ne, levels, self._target)):
+            self._retarget(index, levels[index], now)
+        self._subscribe()
+
+    def set_level(self, index, percent):
+        percent = max(0, min(100, percent))
+        if percent != self._target[index]:
+            self._retarget(index, percent, AnimationClock.instance().now())
+            self._subscribe()
+
+    def level(self, index):
+        return self._current[index]
+
+    def set_fill_color(self, index, color):
+        self._fill[index] = QColor(color).rgba()
+        self.update(self.cell_rect(index))
+
+    def cell_rect(self, index):
+        row, col = divmod(index, self._columns)
+        return QRect(col * self._cell_width, row * self._cell_height, self._cell_width, self._cell_height)
+
+    def is_animating(self):
+        return bool(self._animating)
+
+    # Animation
+    def _retarget(self, index, level, now):
+        current = self._current[index]
+        self._start[index] = current
+        self._target[index] = level
+        self._start_time[index] = now
+        self._duration[index] = min(abs(level - current) * self.ms_per_percent, self.max_duration)
+        self._animating.add(index)
+
+    def _subscribe(self):
+        if self._animating:
+            AnimationClock.instance().subscribe(self.animate_fill)
+
+    def animate_fill(self, now):
+        """Advance every moving gauge to the shared clock's time."""
+        current, start, target = self._current, self._start, self._target
+        start_time, duration = self._start_time, self._duration
+        value_for_progress = self._easing.valueForProgress
+        finished = []
+        for index in self._animating:
+            elapsed = now - start_time[index]
+            if elapsed >= duration[index]:
+                current[index] = target[index]
+                finished.append(index)
+            else:
+                progress = value_for_progress(elapsed / duration[index])
+                current[index] = start[index] + (target[index] - start[index]) * progress
+            self.update(self.cell_rect(index))
+        self._animating.difference_update(finished)
+        return bool(self._animating)
+
+    # Painting
+    def _prototype(self, kind):
+        prototype = self._prototypes.get(kind)
+        if prototype is None:
+            prototype = self.KINDS[kind](
+                fill_color=QColor("#3498db"),
+                background_color=self._background_color,
+                border_color=self._border_color,
+                parent=self,
+            )
+            prototype.hide()
+            prototype.resize(prototype.sizeHint())
+            self._prototypes[kind] = prototype
+        return prototype
+
+    def _update_size(self):
+        rows = math.ceil(len(self._current) / self._columns)
+        self.setMinimumSize(min(len(self._current), self._columns) * self._cell_width,
+                            rows * self._cell_height)
+
+    def sizeHint(self):
+        return self.minimumSize()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self._wall_color)
+        if not self._cell_width:
+            return
+        dpr = self.devicePixelRatioF()
+        region = event.region()
+        rect = event.rect()
+
+        # Only the cells inside the dirty region
+        first_col = max(rect.left() // self._cell_width, 0)
+        last_col = min(rect.right() // self._cell_width, self._columns - 1)
+        first_row = max(rect.top() // self._cell_height, 0)
+        last_row = rect.bottom() // self._cell_height
+        dirty = []
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                index = row * self._columns + col
+                if index >= len(self._current):
+                    break
+                if region.intersects(self.cell_rect(index)):
+                    dirty.append(index)
+
+        # Cells do not overlap, so drawing them grouped by kind and color
+        # gives the same picture with one fill brush rebuild per color
+        dirty.sort(key=lambda index: (self._kinds[index], self._fill[index]))
+        for index in dirty:
+            prototype = self._prototype(self._kind_names[self._kinds[index]])
+            if prototype._fill_color.rgba() != self._fill[index]:
+                prototype._fill_color = QColor.fromRgba(self._fill[index])
+            cell = self.cell_rect(index)
+            painter.save()
+            painter.translate(cell.left() + (cell.width() - prototype.width()) // 2,
+                              cell.top() + (cell.height() - prototype.height()) // 2)
+            prototype.paint_gauge(painter, self._current[index], dpr)
+            painter.restore()
+        self.painted_gauges = len(dirty)
+
+
+# --- Demo usage ---
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    colors = ["#FFAA5C", "#4CAF50", "#3498DB", "#E74C3C", "#9B59B6"]
+
+    wall = GaugeWall(columns=25)
+    for i in range(300):
+        wall.add_gauge("beaker" if i % 3 else "tube", QColor(random.choice(colors)))
+
+    # Each tick moves a handful of tanks; only their cells repaint
+    levels = [random.randint(0, 100) for _ in range(wall.count())]
+
+    def tick():
+        for i in random.sample(range(wall.count()), 20):
+            levels[i] = random.randint(0, 100)
+        wall.set_levels(levels)
+
+    timer = QTimer()
+    timer.timeout.connect(tick)
+    timer.start(500)
+    wall.set_levels(levels)
+
+    wall.setWindowTitle("Gauge Wall")
+    wall.show()
+    sys.exit(app.exec_())
@@ -0,0 +1,169 @@
+import multiprocessing
+import os
+import sys
+import time
+
+from PyQt5 import sip
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QImage, QPainter, QColor
+
+
+BACKGROUNDS = {"dark": "#1e1e1e", "light": "#ffffff"}
+
+_app = None
+
+
+def _application():
+    """
+    The process-wide QApplication, created on first use and kept for later
+    specs. A QApplication created here renders offscreen unless
+    QT_QPA_PLATFORM says otherwise; an application that already exists
+    (a GUI importing this module) is used as is.
+    """
+    global _app
+    if _app is None:
+        _app = QApplication.instance()
+        if _app is None:
+            # Must be set before Qt creates its platform integration
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+            _app = QApplication([sys.argv[0] if sys.argv else "render"])
+    return _app
+
+
+def _render_gauge(spec):
+    from beaker_widget import BeakerWidget
+    from progress_bar import TestTubeWidget
+
+    cls = BeakerWidget if spec["type"] == "beaker" else TestTubeWidget
+    colors = {name: QColor(spec[name]) for name in ("fill_color", "background_color", "border_color")
+              if name in spec}
+    gauge = cls(**colors)
+    width, height = spec.get("size") or (gauge.sizeHint().width(), gauge.sizeHint().height())
+    gauge.resize(width, height)
+    dpr = spec.get("dpr", 1)
+
+    image = QImage(round(width * dpr), round(height * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    background = QColor(BACKGROUNDS.get(spec.get("theme", "dark"), spec.get("theme")))
+    image.fill(background)
+    # The label is drawn straight onto the theme background, so it follows it
+    gauge.setTextColor(QColor(spec["text_color"]) if "text_color" in spec
+                       else QColor("#000000" if background.lightness() > 127 else "#ffffff"))
+    painter = QPainter(image)
+    gauge.paint_gauge(painter, max(0, min(100, spec.get("value", 0))), dpr)
+    painter.end()
+    # Workers never return to an event loop, so deleteLater() would never run
+    sip.delete(gauge)
+    return image
+
+
+def _render_table(spec):
+    from tableqt import MaterialTableWidget
+
+    table = MaterialTableWidget(spec.get("theme", "light"), spec.get("headers"), spec.get("column_types"))
+    table.setAttribute(Qt.WA_DontShowOnScreen)
+    table.resize(*(spec.get("size") or (640, 480)))
+    table.add_rows(spec.get("value") or [])
+    table.show()
+    _application().processEvents()
+    image = table.grab().toImage()
+    table.proxy.close()
+    table.search_index.close()
+    sip.delete(table)
+    return image
+
+
+RENDERERS = {"beaker": _render_gauge, "tube": _render_gauge, "table": _render_table}
+
+
+def render_spec(spec):
+    """
+    Render one spec and return PNG bytes, or the path when spec has "path".
+
+    Spec keys: type ("beaker", "tube" or "table"), value (a percent for
+    gauges, rows for tables), theme, size ((width, height)), and optionally
+    dpr, path, headers/column_types for tables and fill_color/
+    background_color/border_color/text_color for gauges. Without text_color
+    the gauge label is black on light themes and white on dark ones.
+    """
+    _application()
+    renderer = RENDERERS.get(spec.get("type"))
+    if renderer is None:
+        raise ValueError(f"unknown widget type {spec.get('type')!r}")
+    image = renderer(spec)
+
+    if spec.get("path"):
+        if not image.save(spec["path"], "PNG"):
+            raise OSError(f"could not write {spec['path']}")
+        return spec["path"]
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+
+class HeadlessRenderer:
+    """
+    Renders batches of specs on a pool of worker processes. Each worker
+    builds its QApplication once, in the pool initializer, and keeps it for
+    every spec it is handed, so Qt start-up is paid once per core rather than
+    once per image. processes=0 renders in the calling process instead.
+
+    Workers are spawned, not forked, so scripts using this need the usual
+    `if __name__ == "__main__":` guard.
+    """
+
+    def __init__(self, processes=None, chunk_size=4):
+        self.processes = os.cpu_count() if processes is None else processes
+        self.chunk_size = chunk_size
+        self._pool = None
+        if self.processes:
+            context = multiprocessing.get_context("spawn")
+            self._pool = context.Pool(self.processes, initializer=_application)
+
+    def render(self, specs):
+        """Results in the order of specs: PNG bytes, or paths for specs with "path"."""
+        if self._pool is None:
+            return [render_spec(spec) for spec in specs]
+        return self._pool.map(render_spec, specs, self.chunk_size)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def render_specs(specs, processes=None, chunk_size=4):
+    """One-shot helper: render specs on a temporary pool."""
+    with HeadlessRenderer(processes, chunk_size) as renderer:
+        return renderer.render(specs)
+
+
+# --- Demo usage ---
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    out = tempfile.mkdtemp(prefix="gauges-")
+    specs = []
+    for i in range(200):
+        kind = random.choice(["beaker", "tube"])
+        specs.append({"type": kind, "value": random.randint(0, 100), "theme": "dark",
+                      "path": os.path.join(out, f"{kind}-{i:03}.png")})
+    specs.append({"type": "table", "theme": "dark", "size": (480, 240),
+                  "headers": ["Name", "Age", "City"], "column_types": {"Age": int},
+                  "value": [["Alice", 24, "New York"], ["Bob", 30, "London"]],
+                  "path": os.path.join(out, "table.png")})
+
+    start = time.perf_counter()
+    render_specs(specs)
+    print(f"rendered {len(specs)} images to {out} in {time.perf_counter() - start:.2f}s")
@@ -1,114 +1,153 @@
 from PyQt5.QtWidgets import QWidget, QApplication, QVBoxLayout, QPushButton
-from PyQt5.QtCore import Qt, QRectF, QTimer, pyqtProperty
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QLinearGradient, QFont, QPainterPath
+from PyQt5.QtCore import Qt, QRectF, QSize, pyqtProperty
+from PyQt5.QtGui import QPainter, QColor, QPen, QPainterPath, QTransform
+from collections import OrderedDict
 import sys
 import random
 
+from gauge_base import GaugeGeometry, GaugeWidget
 
-class TestTubeWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
 
-        self._fill_color = QColor("#2ecc71")  # Greenish fill
-        self._background_color = QColor("#111111")
-        self._border_color = QColor("#555555")
+class TubeGeometry(GaugeGeometry):
+    """
+    Outline, glass, clip path and label font of a test tube. Liquid shapes
+    near the rounded ends are cached here too, so equal-sized tubes share
+    them.
+    """
 
-        self._current_percent = 0
-        self._target_percent = 0
+    DESIGN_WIDTH = 90
+    DESIGN_HEIGHT = 280
 
-        # Fixed internal size to avoid scaling issues
-        self._tube_width = 50
-        self._tube_height = 200
-        self.setFixedSize(self._tube_width + 40, self._tube_height + 80)
+    def __init__(self, width, height, dpr, background_color, border_color):
+        super().__init__(width, height, dpr)
+        scale, x, y = self.scale, self.x, self.y
 
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self.animate_fill)
-        self._animation_step = 1
+        margin = 12 * scale
+        padding = 3 * scale
+        self.tube_rect = tube_rect = QRectF(x + margin, y + margin, 50 * scale, 200 * scale)
+        border_radius = tube_rect.width() / 2
 
-        self.setStyleSheet("background-color: #1e1e1e;")
+        # Inner rect (glass content area), also the clip region of the fill.
+        # Rounded rects clamp their radius to half the width, so the
+        # hand-built liquid arcs use the clamped value too.
+        self.inner_rect = inner_rect = tube_rect.adjusted(padding, padding, -padding, -padding)
+        self.clip_radius = clip_radius = min(border_radius - 2 * scale, inner_rect.width() / 2)
+        self.clip_path = QPainterPath()
+        self.clip_path.addRoundedRect(inner_rect, clip_radius, clip_radius)
+        self.fill_paths = OrderedDict()
 
-    def setFillPercent(self, percent):
-        self._target_percent = max(0, min(100, percent))
-        if not self._timer.isActive():
-            self._timer.start(10)
+        self._label(tube_rect.bottom())
+        self.spark_rect = QRectF(x + 8 * scale, self.text_rect.bottom() + 2 * scale,
+                                 (self.DESIGN_WIDTH - 16) * scale, 26 * scale)
 
-    def animate_fill(self):
-        if self._current_percent < self._target_percent:
-            self._current_percent += self._animation_step
-            if self._current_percent > self._target_percent:
-                self._current_percent = self._target_percent
-        elif self._current_percent > self._target_percent:
-            self._current_percent -= self._animation_step
-            if self._current_percent < self._target_percent:
-                self._current_percent = self._target_percent
-        else:
-            self._timer.stop()
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        margin = 12
-        padding = 3
-        tube_rect = QRectF(margin, margin, self._tube_width, self._tube_height)
-        border_radius = self._tube_width / 2
-
-        # Inner rect (glass content area)
-        inner_rect = tube_rect.adjusted(padding, padding, -padding, -padding)
-
-        # Draw inner glass background
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(self._background_color)
-        painter.drawRoundedRect(inner_rect, border_radius - 2, border_radius - 2)
+        def glass(painter):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(background_color)
+            painter.drawRoundedRect(inner_rect, clip_radius, clip_radius)
+
+        def outline(painter):
+            painter.setPen(QPen(border_color, 2 * scale))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRoundedRect(tube_rect, border_radius, border_radius)
+
+        self.glass_layer = self._layer(glass)
+        self.outline_layer = self._layer(outline)
+
+    def fill_path(self, fill_top):
+        """Liquid shape for a level: rounded top, clipped to the tube's rounded bottom."""
+        inner_rect = self.inner_rect
+        left = inner_rect.left()
+        right = inner_rect.right()
+        top = fill_top
+        bottom = inner_rect.bottom()
+        width = inner_rect.width()
+        clip_radius = self.clip_radius
+        corner_radius = min(bottom - top, width) / 2
+
+        if top >= inner_rect.top() + clip_radius and top + corner_radius <= bottom - clip_radius:
+            # The meniscus clears the rounded ends, so the clipped shape can be
+            # written down directly instead of intersecting paths
+            path = QPainterPath()
+            path.moveTo(left, top + corner_radius)
+            path.quadTo(left, top, left + corner_radius, top)
+            path.lineTo(right - corner_radius, top)
+            path.quadTo(right, top, right, top + corner_radius)
+            path.lineTo(right, bottom - clip_radius)
+            path.arcTo(QRectF(right - 2 * clip_radius, bottom - 2 * clip_radius,
+                              2 * clip_radius, 2 * clip_radius), 0, -90)
+            path.lineTo(left + clip_radius, bottom)
+            path.arcTo(QRectF(left, bottom - 2 * clip_radius, 2 * clip_radius, 2 * clip_radius), 270, -90)
+            path.closeSubpath()
+            return path
+
+        # Near empty or full: intersect with the cached clip path, once per
+        # quarter device pixel
+        key = round(fill_top * self.dpr * 4)
+        path = self.fill_paths.get(key)
+        if path is not None:
+            self.fill_paths.move_to_end(key)
+            return path
+
+        # Rounded top and flat bottom
+        path = QPainterPath()
+        path.moveTo(left, bottom)
+        path.lineTo(right, bottom)
+        path.lineTo(right, top + corner_radius)
+        path.quadTo(right, top, right - corner_radius, top)
+        path.lineTo(left + corner_radius, top)
+        path.quadTo(left, top, left, top + corner_radius)
+        path.lineTo(left, bottom)
+        path = path.intersected(self.clip_path)
+
+        self.fill_paths[key] = path
+        if len(self.fill_paths) > 256:
+            self.fill_paths.popitem(last=False)
+        return path
+
+
+class TestTubeWidget(GaugeWidget):
+    geometry_class = TubeGeometry
+    gradient_lighter = 130
+
+    def __init__(
+        self,
+        parent=None,
+        fill_color=QColor("#2ecc71"),  # Greenish fill
+        background_color=QColor("#111111"),
+        border_color=QColor("#555555")
+    ):
+        super().__init__(fill_color, background_color, border_color, parent)
+
+    def minimumSizeHint(self):
+        return QSize(20, 62)
+
+    def paint_gauge(self, painter, percent, dpr):
+        """Draw the gauge at percent, origin at its top-left. GaugeWall paints through this too."""
+        geometry = self._ensure_geometry(dpr)
+        self._ensure_fill_brush()
+        painter.drawPixmap(0, 0, geometry.glass_layer)
 
         # Draw fill
-        fill_height = inner_rect.height() * (self._current_percent / 100.0)
+        inner_rect = geometry.inner_rect
+        fill_height = inner_rect.height() * (percent / 100.0)
         fill_top = inner_rect.bottom() - fill_height
-        fill_rect = QRectF(inner_rect.left(), fill_top, inner_rect.width(), fill_height)
-
         if fill_height > 1:
-            gradient = QLinearGradient(fill_rect.topLeft(), fill_rect.bottomLeft())
-            gradient.setColorAt(0.0, self._fill_color.lighter(130))
-            gradient.setColorAt(1.0, self._fill_color.darker(130))
-            painter.setBrush(QBrush(gradient))
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._fill_brush.setTransform(QTransform.fromTranslate(0, fill_top).scale(1, fill_height))
+            painter.setBrush(self._fill_brush)
             painter.setPen(Qt.NoPen)
+            painter.drawPath(geometry.fill_path(fill_top))
 
-            # Create a fill path with rounded top and flat bottom
-            path = QPainterPath()
-            corner_radius = min(fill_rect.height(), fill_rect.width()) / 2
-
-            left = fill_rect.left()
-            right = fill_rect.right()
-            top = fill_rect.top()
-            bottom = fill_rect.bottom()
-
-            path.moveTo(left, bottom)
-            path.lineTo(right, bottom)
-            path.lineTo(right, top + corner_radius)
-            path.quadTo(right, top, right - corner_radius, top)
-            path.lineTo(left + corner_radius, top)
-            path.quadTo(left, top, left, top + corner_radius)
-            path.lineTo(left, bottom)
-
-            # Clip path to inner tube boundary
-            clip_path = QPainterPath()
-            clip_path.addRoundedRect(inner_rect, border_radius - 2, border_radius - 2)
-            painter.drawPath(path.intersected(clip_path))
-
-        # Draw glass tube outline
-        painter.setPen(QPen(self._border_color, 2))
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRoundedRect(tube_rect, border_radius, border_radius)
+        painter.drawPixmap(0, 0, geometry.outline_layer)
 
         # Draw percentage label
-        painter.setPen(QColor("#ffffff"))
-        font = QFont("Arial", 10)
-        font.setBold(True)
-        painter.setFont(font)
-        text = f"{int(self._current_percent)}%"
-        text_rect = QRectF(0, tube_rect.bottom() + 8, self.width(), 20)
-        painter.drawText(text_rect, Qt.AlignHCenter | Qt.AlignTop, text)
+        painter.setPen(self._text_color)
+        painter.setFont(geometry.font)
+        painter.drawText(geometry.text_rect, Qt.AlignHCenter | Qt.AlignTop, f"{int(percent)}%")
+
+        if self._history is not None:
+            self._history.draw(painter, geometry.spark_rect, self._history_pen,
+                               self._history_brush if self._history_band else None)
 
 
 # Demo window to show the widget in action
@@ -119,7 +158,7 @@ if __name__ == "__main__":
     layout = QVBoxLayout(window)
 
     test_tube = TestTubeWidget()
-    layout.addWidget(test_tube, alignment=Qt.AlignCenter)
+    layout.addWidget(test_tube, 1)
 
     button = QPushButton("Random Fill")
     button.clicked.connect(lambda: test_tube.setFillPercent(random.randint(0, 100)))
@@ -0,0 +1,130 @@
+import random
+
+from PyQt5.QtCore import Qt, QObject, QTimer
+from PyQt5.QtGui import QFontMetrics
+
+
+class ColumnAutoSizer(QObject):
+    """
+    Sizes a view's columns to their content without measuring every row.
+
+    fit() measures a stratified sample of the model (a short run of adjacent
+    rows from each of `strata` evenly spaced slices, so paged and mmap models
+    touch few pages) plus the rows currently on screen. While enabled, rows
+    that scroll into view or get appended are measured lazily, and columns
+    only ever grow so the layout does not jitter. Widths are cached per
+    distinct string.
+    """
+
+    def __init__(self, view, font, sample_size=1000, strata=32, padding=20,
+                 max_width=480, cache_size=100000, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.font = font
+        self.metrics = QFontMetrics(font)
+        self.sample_size = sample_size
+        self.strata = strata
+        self.padding = padding
+        self.max_width = max_width
+        self.cache_size = cache_size
+        self.enabled = False
+        self.measured_cells = 0
+
+        self._widths = {}
+        self._refine_timer = QTimer(self)
+        self._refine_timer.setSingleShot(True)
+        self._refine_timer.setInterval(50)
+        self._refine_timer.timeout.connect(self.refine)
+        view.verticalScrollBar().valueChanged.connect(self._schedule)
+        self._model = None
+
+    # Public API
+    def set_enabled(self, enabled=True):
+        self.enabled = enabled
+        self._track_model()
+        if enabled:
+            self.fit()
+
+    def set_font(self, font):
+        if font != self.font:
+            self._widths.clear()
+            self.font = font
+            self.metrics = QFontMetrics(font)
+
+    def fit(self):
+        """Size every column from a fresh sample plus the visible rows."""
+        model = self.view.model()
+        if model is None:
+            return
+        rows = sorted(set(self.sample_rows(model.rowCount())) | set(self.visible_rows()))
+        header = self.view.horizontalHeader()
+        for col in range(model.columnCount()):
+            title = model.headerData(col, Qt.Horizontal)
+            width = self._measure_rows(model, col, rows, self.text_width("" if title is None else str(title)))
+            header.resizeSection(col, width)
+
+    def refine(self):
+        """Grow columns that are too narrow for the rows now on screen."""
+        model = self.view.model()
+        if not self.enabled or model is None:
+            return
+        rows = self.visible_rows()
+        header = self.view.horizontalHeader()
+        for col in range(model.columnCount()):
+            width = self._measure_rows(model, col, rows, 0)
+            if width > header.sectionSize(col):
+                header.resizeSection(col, width)
+
+    def sample_rows(self, count):
+        """Up to sample_size row numbers spread evenly over count rows."""
+        if count <= self.sample_size:
+            return range(count)
+        strata = min(self.strata, self.sample_size)
+        run = self.sample_size // strata
+        span = count / strata
+        rows = []
+        for stratum in range(strata):
+            start = int(stratum * span) + random.randrange(max(int(span) - run, 1))
+            rows.extend(range(start, min(start + run, count)))
+        return rows
+
+    def visible_rows(self):
+        view = self.view
+        count = view.model().rowCount() if view.model() is not None else 0
+        if not count:
+            return range(0)
+        first = max(view.rowAt(0), 0)
+        last = view.rowAt(view.viewport().height() - 1)
+        return range(first, (count if last < 0 else last + 1))
+
+    def text_width(self, text):
+        width = self._widths.get(text)
+        if width is None:
+            if len(self._widths) >= self.cache_size:
+                self._widths.clear()
+            width = self._widths[text] = self.metrics.horizontalAdvance(text)
+            self.measured_cells += 1
+        return width
+
+    # Internals
+    def _measure_rows(self, model, col, rows, width):
+        text_width = self.text_width
+        for row in rows:
+            value = model.index(row, col).data()
+            if value is not None:
+                width = max(width, text_width(value if type(value) is str else str(value)))
+        return min(width + self.padding, self.max_width) if rows else width
+
+    def _schedule(self, *args):
+        if self.enabled:
+            self._refine_timer.start()
+
+    def _track_model(self):
+        model = self.view.model()
+        if self._model is not None:
+            self._model.rowsInserted.disconnect(self._schedule)
+            self._model.modelReset.disconnect(self._schedule)
+        self._model = model if self.enabled else None
+        if self._model is not None:
+            model.rowsInserted.connect(self._schedule)
+            model.modelReset.connect(self._schedule)
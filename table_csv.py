@@ -0,0 +1,222 @@
+from itertools import islice
+import csv
+import os
+import threading
+import time
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+from table_ingest import StreamingIngest
+from table_model import column_values
+
+
+class _CsvJob(QObject):
+    """Common plumbing: a worker thread plus progress/finished/failed signals."""
+
+    progress = pyqtSignal(int, int)   # done, total
+    finished = pyqtSignal(int)        # rows processed
+    failed = pyqtSignal(str)
+    _done = pyqtSignal(int, str)
+
+    def __init__(self, model, path, chunk_size, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.path = path
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self._cancelled = False
+        self._thread = None
+        self._done.connect(self._on_done)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._guarded_run, daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _guarded_run(self):
+        try:
+            self._run()
+        except (OSError, ValueError, csv.Error, UnicodeError) as e:
+            # ValueError: the model's file was closed, or it kept changing, under the job
+            self._done.emit(self.rows, str(e))
+        else:
+            self._done.emit(self.rows, "")
+
+    def _on_done(self, rows, error):
+        if error:
+            self.failed.emit(error)
+        else:
+            self.finished.emit(rows)
+
+
+class CsvImportJob(_CsvJob):
+    """
+    Reads a CSV file on a worker thread and feeds it into the model's batch
+    insert path. Parsed chunks go through a blocking StreamingIngest, so at
+    most a few chunks are ever held in memory however large the file is.
+
+    The file's header row is skipped; with use_header=True it also replaces
+    the model's header labels once the import finishes.
+    """
+
+    def __init__(self, model, path, has_header=True, delimiter=",", encoding="utf-8",
+                 chunk_size=20000, use_header=False, parent=None):
+        super().__init__(model, path, chunk_size, parent)
+        self.has_header = has_header
+        self.use_header = use_header
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.header = None
+        self.ingest = StreamingIngest(model, max_batch=chunk_size, capacity=chunk_size * 4,
+                                      policy="block", parent=self)
+
+    def start(self):
+        self.ingest.start()
+        return super().start()
+
+    def _run(self):
+        total = os.path.getsize(self.path)
+        read = 0
+        with open(self.path, "rb") as handle:
+            def lines():
+                nonlocal read
+                for line in handle:
+                    read += len(line)
+                    yield line.decode(self.encoding)
+
+            reader = csv.reader(lines(), delimiter=self.delimiter)
+            if self.has_header:
+                self.header = next(reader, None)
+            while not self._cancelled:
+                chunk = list(islice(reader, self.chunk_size))
+                if not chunk:
+                    break
+                self.ingest.push_many(chunk)
+                self.rows += len(chunk)
+                self.progress.emit(read, total)
+
+    def _on_done(self, rows, error):
+        # Flush whatever the GUI thread has not drained yet
+        self.ingest.stop()
+        if self.use_header and self.header and hasattr(self.model, "setHorizontalHeaderLabels"):
+            model = self.model
+            # Columns the file has no name for keep their current label
+            current = [model.headerData(col, Qt.Horizontal) for col in range(model.columnCount())]
+            model.setHorizontalHeaderLabels(self.header + current[len(self.header):])
+        super()._on_done(rows, error)
+
+
+class CsvExportJob(_CsvJob):
+    """
+    Writes the model to a CSV file on a worker thread, chunk_size rows at a
+    time. Columnar models are read by slicing their column storage; other
+    models through data().
+
+    The GUI thread may change the model meanwhile. A chunk whose columns were
+    read while rows were being changed is read again, so no row mixes cells
+    of different rows. When rows move under rows already written (removals,
+    inserts above the end, resets), the export starts over on the current
+    contents, at most max_restarts times before it fails.
+    """
+
+    max_restarts = 3
+
+    def __init__(self, model, path, delimiter=",", encoding="utf-8", chunk_size=20000, parent=None):
+        super().__init__(model, path, chunk_size, parent)
+        self.delimiter = delimiter
+        self.encoding = encoding
+        # Rows appended after the export starts are not included
+        self.total = model.rowCount()
+        self.restarts = 0
+
+        # _changes is odd while the GUI thread is changing rows, _shifts
+        # counts the changes that moved rows
+        self._changes = 0
+        self._shifts = 0
+        self._connections = [
+            (model.rowsAboutToBeRemoved, self._rows_changing),
+            (model.rowsRemoved, self._changed),
+            (model.rowsAboutToBeInserted, self._rows_changing),
+            (model.rowsInserted, self._changed),
+            (model.modelAboutToBeReset, self._reset_changing),
+            (model.modelReset, self._changed),
+        ]
+        if hasattr(model, "cellsAboutToChange"):
+            self._connections += [
+                (model.cellsAboutToChange, self._cells_changing),
+                (model.dataChanged, self._changed),
+            ]
+        for signal, slot in self._connections:
+            signal.connect(slot)
+
+    # Change tracking (GUI thread)
+    def _rows_changing(self, parent, first, last):
+        # Rows past the exported ones come and go without moving any of them
+        if first < self.total:
+            self._shifts += 1
+        self._changes += 1
+
+    def _reset_changing(self):
+        self._shifts += 1
+        self._changes += 1
+
+    def _cells_changing(self, first, last):
+        self._changes += 1
+
+    def _changed(self, *args):
+        self._changes += 1
+
+    def _on_done(self, rows, error):
+        for signal, slot in self._connections:
+            signal.disconnect(slot)
+        self._connections = []
+        super()._on_done(rows, error)
+
+    # Worker thread
+    def _read_chunk(self, start, end):
+        """Rows start .. end - 1, or None if the model changed while reading them."""
+        changes = self._changes
+        if changes % 2:
+            time.sleep(0.001)
+            return None
+        model = self.model
+        columns = [column_values(model, col, start, end) for col in range(model.columnCount())]
+        if self._changes != changes:
+            return None
+        return zip(*columns)
+
+    def _run(self):
+        model = self.model
+        headers = [model.headerData(col, Qt.Horizontal) for col in range(model.columnCount())]
+        with open(self.path, "w", newline="", encoding=self.encoding) as handle:
+            writer = csv.writer(handle, delimiter=self.delimiter)
+            writer.writerow(headers)
+            shifts = self._shifts
+            start = 0
+            while start < self.total and not self._cancelled:
+                if self._shifts != shifts:
+                    if self.restarts == self.max_restarts:
+                        raise ValueError("the table kept changing during the export")
+                    self.restarts += 1
+                    shifts = self._shifts
+                    handle.seek(0)
+                    handle.truncate()
+                    writer.writerow(headers)
+                    self.total = model.rowCount()
+                    self.rows = start = 0
+                    continue
+                end = min(start + self.chunk_size, self.total, model.rowCount())
+                if end <= start:
+                    break
+                chunk = self._read_chunk(start, end)
+                if chunk is None:
+                    continue
+                writer.writerows(chunk)
+                self.rows = start = end
+                self.progress.emit(end, self.total)
@@ -0,0 +1,231 @@
+from collections import Counter
+
+from PyQt5.QtCore import Qt, QEvent, QObject, QRect, pyqtSignal
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QToolTip, QWidget
+
+from table_model import column_values
+
+
+class ColumnStats:
+    """
+    Running aggregates of one column. Values are added and removed in batches;
+    a value -> occurrences counter gives the distinct count and lets min/max
+    survive removals (they are only recomputed when the extreme value itself
+    disappears).
+    """
+
+    def __init__(self, numeric):
+        self.numeric = numeric
+        self.count = 0
+        self.total = 0
+        self._counts = Counter()
+        self._min = None
+        self._max = None
+        self._extremes_dirty = False
+
+    def add(self, values):
+        if not values:
+            return
+        self.count += len(values)
+        if self.numeric:
+            self.total += sum(values)
+        self._counts.update(values)
+        if not self._extremes_dirty:
+            low, high = min(values), max(values)
+            self._min = low if self._min is None else min(self._min, low)
+            self._max = high if self._max is None else max(self._max, high)
+
+    def remove(self, values):
+        if not values:
+            return
+        self.count -= len(values)
+        if self.numeric:
+            self.total -= sum(values)
+        counts = self._counts
+        counts.subtract(values)
+        for value in set(values):
+            if counts[value] <= 0:
+                del counts[value]
+                if value == self._min or value == self._max:
+                    self._extremes_dirty = True
+
+    def _refresh_extremes(self):
+        if self._extremes_dirty:
+            self._min = min(self._counts) if self._counts else None
+            self._max = max(self._counts) if self._counts else None
+            self._extremes_dirty = False
+
+    def minimum(self):
+        self._refresh_extremes()
+        return self._min
+
+    def maximum(self):
+        self._refresh_extremes()
+        return self._max
+
+    def mean(self):
+        return self.total / self.count if self.numeric and self.count else None
+
+    def distinct(self):
+        return len(self._counts)
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.total if self.numeric else None,
+            "min": self.minimum(),
+            "max": self.maximum(),
+            "mean": self.mean(),
+            "distinct": self.distinct(),
+        }
+
+
+class AggregateTracker(QObject):
+    """
+    Keeps ColumnStats for every column of a model in sync with inserts,
+    removals and edits, reading only the affected rows. Edits are handled
+    through ColumnarTableModel.cellsAboutToChange; a model reset rescans.
+    """
+
+    changed = pyqtSignal()
+
+    def __init__(self, model=None, parent=None):
+        super().__init__(parent)
+        self.model = None
+        self.stats = []
+        if model is not None:
+            self.set_model(model)
+
+    def set_model(self, model):
+        if self.model is not None:
+            for signal, slot in self._model_connections(self.model):
+                signal.disconnect(slot)
+        self.model = model
+        for signal, slot in self._model_connections(model):
+            signal.connect(slot)
+        self.rescan()
+
+    def rescan(self):
+        model = self.model
+        self.stats = []
+        for col in range(model.columnCount()):
+            column_type = model.column_type(col) if hasattr(model, "column_type") else str
+            self.stats.append(ColumnStats(column_type in (int, float)))
+        self._add(0, model.rowCount() - 1)
+        self.changed.emit()
+
+    def _model_connections(self, model):
+        connections = [
+            (model.rowsInserted, self._rows_inserted),
+            (model.rowsAboutToBeRemoved, self._rows_about_to_be_removed),
+            (model.rowsRemoved, self._emit_changed),
+            (model.modelReset, self.rescan),
+            (model.layoutChanged, self.rescan),
+        ]
+        if hasattr(model, "cellsAboutToChange"):
+            connections += [
+                (model.cellsAboutToChange, self._remove),
+                (model.dataChanged, self._data_changed),
+            ]
+        else:
+            # Old values are gone by the time dataChanged arrives
+            connections.append((model.dataChanged, self.rescan))
+        return connections
+
+    def _values(self, col, first, last):
+        values = column_values(self.model, col, first, last + 1)
+        # Paged models answer None for rows that are not loaded yet
+        return [value for value in values if value is not None] if None in values else values
+
+    def _add(self, first, last):
+        if last < first:
+            return
+        for col, stats in enumerate(self.stats):
+            stats.add(self._values(col, first, last))
+
+    def _remove(self, first, last):
+        for col, stats in enumerate(self.stats):
+            stats.remove(self._values(col, first, last))
+
+    def _rows_inserted(self, parent, first, last):
+        self._add(first, last)
+        self.changed.emit()
+
+    def _rows_about_to_be_removed(self, parent, first, last):
+        self._remove(first, last)
+
+    def _data_changed(self, top_left, bottom_right, roles=()):
+        self._add(top_left.row(), bottom_right.row())
+        self.changed.emit()
+
+    def _emit_changed(self, *args):
+        self.changed.emit()
+
+
+def _format(value):
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return "" if value is None else str(value)
+
+
+class AggregateFooter(QWidget):
+    """
+    Footer row under a table view that shows each column's aggregates,
+    aligned with the header sections.
+    """
+
+    NUMERIC = ("sum", "mean", "min", "max")
+    TEXT = ("count", "distinct")
+    LABELS = {"count": "n", "sum": "Σ", "mean": "μ", "min": "min", "max": "max", "distinct": "distinct"}
+
+    def __init__(self, view, tracker, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.tracker = tracker
+        self.setFixedHeight(28)
+
+        header = view.horizontalHeader()
+        header.sectionResized.connect(self.update)
+        header.sectionMoved.connect(self.update)
+        header.geometriesChanged.connect(self.update)
+        view.horizontalScrollBar().valueChanged.connect(self.update)
+        tracker.changed.connect(self.update)
+
+    def column_text(self, col):
+        stats = self.tracker.stats[col]
+        values = stats.as_dict()
+        keys = self.NUMERIC if stats.numeric else self.TEXT
+        return "  ".join(f"{self.LABELS[key]} {_format(values[key])}" for key in keys)
+
+    def event(self, event):
+        # Narrow columns elide their text; the tooltip carries all of it
+        if event.type() == QEvent.ToolTip:
+            header = self.view.horizontalHeader()
+            col = header.logicalIndexAt(event.pos().x() - self.view.viewport().x())
+            if 0 <= col < len(self.tracker.stats):
+                values = self.tracker.stats[col].as_dict()
+                text = "\n".join(f"{key}: {_format(value)}" for key, value in values.items()
+                                 if value is not None)
+                QToolTip.showText(event.globalPos(), text, self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().event(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setPen(self.view.palette().color(self.view.foregroundRole()))
+        header = self.view.horizontalHeader()
+        offset = self.view.viewport().x()
+        for col in range(min(header.count(), len(self.tracker.stats))):
+            if header.isSectionHidden(col):
+                continue
+            x = header.sectionViewportPosition(col) + offset
+            rect = QRect(x + 10, 0, header.sectionSize(col) - 20, self.height())
+            if rect.right() < 0 or rect.left() > self.width():
+                continue
+            text = painter.fontMetrics().elidedText(self.column_text(col), Qt.ElideRight, rect.width())
+            painter.drawText(rect, Qt.AlignVCenter | Qt.AlignLeft, text)
@@ -0,0 +1,126 @@
+from collections import deque
+import threading
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class StreamingIngest(QObject):
+    """
+    Bounded, thread-safe row queue that is drained into a table model on the
+    GUI thread, one batch per frame.
+
+    Producers call push()/push_many() from any thread. When the queue is full
+    the overflow policy decides what happens:
+      "drop_oldest" - discard the oldest queued rows
+      "drop_newest" - discard the incoming rows
+      "block"       - wait until the GUI thread has drained some rows; while
+                      the ingest is not started (or stopped) nothing drains,
+                      so rows that do not fit are rejected instead
+    """
+
+    drained = pyqtSignal(int)
+
+    def __init__(self, model, max_batch=5000, capacity=100000, policy="drop_oldest",
+                 interval=16, parent=None):
+        super().__init__(parent)
+        if policy not in ("drop_oldest", "drop_newest", "block"):
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self.model = model
+        self.max_batch = max_batch
+        self.capacity = capacity
+        self.policy = policy
+
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._threads = []
+        self._running = False
+
+        # Counters
+        self.pushed_count = 0
+        self.dropped_count = 0
+        self.ingested_count = 0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.drain)
+
+    # Lifecycle (GUI thread)
+    def start(self):
+        self._running = True
+        self._timer.start()
+
+    def stop(self):
+        self._running = False
+        self._timer.stop()
+        self.drain(all_rows=True)
+        with self._lock:
+            self._not_full.notify_all()
+
+    def is_active(self):
+        return self._running
+
+    # Producer side (any thread)
+    def push(self, row):
+        return self.push_many((row,))
+
+    def push_many(self, rows):
+        """Queue rows, returns how many were accepted."""
+        rows = list(rows)
+        accepted = 0
+        with self._lock:
+            self.pushed_count += len(rows)
+            for row in rows:
+                if len(self._queue) >= self.capacity:
+                    if self.policy == "drop_oldest":
+                        self._queue.popleft()
+                        self.dropped_count += 1
+                    else:
+                        if self.policy == "block":
+                            while len(self._queue) >= self.capacity and self._running:
+                                self._not_full.wait(0.1)
+                        if len(self._queue) >= self.capacity:
+                            # drop_newest, or blocking while stopped: nothing would
+                            # ever drain the queue, so the rest is rejected
+                            self.dropped_count += len(rows) - accepted
+                            return accepted
+                self._queue.append(row)
+                accepted += 1
+        return accepted
+
+    def feed(self, rows):
+        """Push rows from an iterable on a background Python thread."""
+        thread = threading.Thread(target=self._feed, args=(rows,), daemon=True)
+        self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+        thread.start()
+        return thread
+
+    def _feed(self, rows):
+        for row in rows:
+            self.push(row)
+
+    # Counters
+    def queued_count(self):
+        with self._lock:
+            return len(self._queue)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "queued": len(self._queue),
+                "pushed": self.pushed_count,
+                "dropped": self.dropped_count,
+                "ingested": self.ingested_count,
+            }
+
+    # Consumer side (GUI thread)
+    def drain(self, all_rows=False):
+        with self._lock:
+            count = len(self._queue) if all_rows else min(len(self._queue), self.max_batch)
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._not_full.notify_all()
+        if batch:
+            self.model.append_rows(batch)
+            self.ingested_count += len(batch)
+            self.drained.emit(len(batch))
+        return len(batch)
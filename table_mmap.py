@@ -0,0 +1,305 @@
+from array import array
+from itertools import islice
+import csv
+import mmap
+import shutil
+import struct
+import tempfile
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from table_model import column_values
+
+
+# File layout (little endian, sections 8-byte aligned):
+#
+#   header   "MTBL" | version u16 | column count u16 | row count u64
+#   columns  kind u8 ("q" int64, "d" float64, "s" string) | name length u16 |
+#            name utf-8 | section offsets u64 x2
+#   numeric  row count * 8 bytes             (offsets: data, 0)
+#   string   (row count + 1) u64 end offsets  (offsets: index, heap)
+#            followed by the utf-8 string heap
+MAGIC = b"MTBL"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHQ")
+_COLUMN = struct.Struct("<cH")
+_SECTION = struct.Struct("<QQ")
+
+_KINDS = {int: b"q", float: b"d", str: b"s"}
+_TYPES = {kind: column_type for column_type, kind in _KINDS.items()}
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _to_number(column_type, value):
+    try:
+        if column_type is int and isinstance(value, str) and "." in value:
+            return int(float(value))
+        return column_type(value) if value not in (None, "") else column_type()
+    except (TypeError, ValueError):
+        return column_type()
+
+
+def infer_column_types(rows):
+    """Guess int/float/str for each column from a sample of text rows."""
+    types = None
+    for row in rows:
+        if types is None:
+            types = [int] * len(row)
+        for col, value in enumerate(row[:len(types)]):
+            if types[col] is str or value in (None, ""):
+                continue
+            try:
+                types[col](value)
+            except ValueError:
+                try:
+                    float(value)
+                    types[col] = float
+                except ValueError:
+                    types[col] = str
+    return types or []
+
+
+class TableFileWriter:
+    """
+    Streams rows into the memory-mapped table format.
+
+    Each column is spooled to its own temporary file while rows arrive, so
+    arbitrarily large inputs are written without holding them in memory.
+    """
+
+    def __init__(self, path, headers, column_types=None):
+        self.path = path
+        self.headers = list(headers)
+        self.types = list(column_types) if column_types else [str] * len(self.headers)
+        self.row_count = 0
+
+        self._parts = []
+        for column_type in self.types:
+            if column_type is str:
+                index = tempfile.TemporaryFile()
+                array("Q", [0]).tofile(index)
+                self._parts.append([index, tempfile.TemporaryFile(), 0])
+            else:
+                self._parts.append([tempfile.TemporaryFile()])
+
+    def append_rows(self, rows):
+        rows = [tuple(row) for row in rows]
+        if not rows:
+            return
+        width = len(self.types)
+        rows = [row if len(row) == width else (row + (None,) * width)[:width] for row in rows]
+        for column_type, part, values in zip(self.types, self._parts, zip(*rows)):
+            if column_type is str:
+                encoded = [("" if v is None else str(v)).encode("utf-8") for v in values]
+                ends = array("Q")
+                end = part[2]
+                for value in encoded:
+                    end += len(value)
+                    ends.append(end)
+                part[2] = end
+                ends.tofile(part[0])
+                part[1].write(b"".join(encoded))
+            else:
+                typecode = _KINDS[column_type].decode()
+                array(typecode, (_to_number(column_type, v) for v in values)).tofile(part[0])
+        self.row_count += len(rows)
+
+    def close(self):
+        names = [header.encode("utf-8") for header in self.headers]
+        offset = _HEADER.size + sum(_COLUMN.size + len(name) + _SECTION.size for name in names)
+
+        # Work out where each section lands
+        sections = []
+        for column_type, part in zip(self.types, self._parts):
+            offset = _align(offset)
+            if column_type is str:
+                heap = _align(offset + (self.row_count + 1) * 8)
+                sections.append((offset, heap))
+                offset = heap + part[2]
+            else:
+                sections.append((offset, 0))
+                offset += self.row_count * 8
+
+        with open(self.path, "wb") as out:
+            out.write(_HEADER.pack(MAGIC, VERSION, len(self.types), self.row_count))
+            for column_type, name, section in zip(self.types, names, sections):
+                out.write(_COLUMN.pack(_KINDS[column_type], len(name)))
+                out.write(name)
+                out.write(_SECTION.pack(*section))
+            for column_type, part, section in zip(self.types, self._parts, sections):
+                spools = list(zip(section, part[:2])) if column_type is str else [(section[0], part[0])]
+                for start, spool in spools:
+                    out.write(b"\0" * (start - out.tell()))
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, out, 1 << 20)
+                    spool.close()
+        self._parts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class TableFile:
+    """
+    Read-only view over a table file. Opening only parses the header; cells are
+    read straight out of the mapped buffer.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._map)
+
+        magic, version, column_count, self.row_count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            buffer.release()
+            self.close()
+            raise ValueError(f"{path} is not a table file")
+
+        self.headers = []
+        self.types = []
+        self._columns = []
+        offset = _HEADER.size
+        for _ in range(column_count):
+            kind, name_length = _COLUMN.unpack_from(buffer, offset)
+            offset += _COLUMN.size
+            self.headers.append(bytes(buffer[offset:offset + name_length]).decode("utf-8"))
+            offset += name_length
+            start, heap = _SECTION.unpack_from(buffer, offset)
+            offset += _SECTION.size
+
+            column_type = _TYPES[kind]
+            self.types.append(column_type)
+            if column_type is str:
+                ends = buffer[start:start + (self.row_count + 1) * 8].cast("Q")
+                self._columns.append((ends, buffer[heap:heap + ends[self.row_count]]))
+            else:
+                self._columns.append(buffer[start:start + self.row_count * 8].cast(kind.decode()))
+        self._buffer = buffer
+
+    def _check_open(self):
+        if self._map is None:
+            raise ValueError(f"{self.path} is closed")
+
+    def column(self, col):
+        """Zero-copy typed view of a numeric column."""
+        self._check_open()
+        if self.types[col] is str:
+            raise TypeError("String columns have no flat view")
+        return self._columns[col]
+
+    def cell(self, row, col):
+        self._check_open()
+        column = self._columns[col]
+        if self.types[col] is str:
+            ends, heap = column
+            return str(heap[ends[row]:ends[row + 1]], "utf-8")
+        return column[row]
+
+    def close(self):
+        views = [view for column in getattr(self, "_columns", [])
+                 for view in (column if isinstance(column, tuple) else (column,))]
+        if getattr(self, "_buffer", None) is not None:
+            views.append(self._buffer)
+        self._columns = []
+        self._buffer = None
+        for view in views:
+            try:
+                view.release()
+            except BufferError:
+                pass
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # A worker still reads a slice of the file; the mapping is
+                # unmapped once the last of those views is gone
+                pass
+            self._map = None
+        self._file.close()
+
+
+class MmapTableModel(QAbstractTableModel):
+    """Read-only table model backed by a memory-mapped TableFile."""
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.table_file = TableFile(path)
+
+    def column(self, col):
+        return self.table_file.column(col)
+
+    def column_type(self, col):
+        return self.table_file.types[col]
+
+    def close(self):
+        self.beginResetModel()
+        try:
+            self.table_file.close()
+        finally:
+            self.table_file.row_count = 0
+            self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.table_file.row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.table_file.types)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self.table_file.cell(index.row(), index.column())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal and section < len(self.table_file.headers):
+            return self.table_file.headers[section]
+        return str(section + 1)
+
+
+# Converters
+def csv_to_table(csv_path, path, column_types=None, delimiter=",", encoding="utf-8",
+                 chunk_size=50000):
+    """
+    Convert a CSV file (first line is the header) in chunks. Without
+    column_types the types are inferred from the first chunk; later values
+    that do not parse in a numeric column are stored as 0.
+    """
+    with open(csv_path, newline="", encoding=encoding) as handle:
+        reader = csv.reader(handle, delimiter=delimiter)
+        headers = next(reader, [])
+        chunk = list(islice(reader, chunk_size))
+        if column_types is None:
+            column_types = infer_column_types(chunk) or [str] * len(headers)
+            column_types += [str] * (len(headers) - len(column_types))
+        with TableFileWriter(path, headers, column_types[:len(headers)]) as writer:
+            while chunk:
+                writer.append_rows(chunk)
+                chunk = list(islice(reader, chunk_size))
+    return path
+
+
+def model_to_table(model, path, column_types=None, chunk_size=50000):
+    """Write any Qt table model (QStandardItemModel, ColumnarTableModel, ...) to a table file."""
+    columns = model.columnCount()
+    headers = [str(model.headerData(col, Qt.Horizontal)) for col in range(columns)]
+    if column_types is None:
+        column_types = [model.column_type(col) if hasattr(model, "column_type") else str
+                        for col in range(columns)]
+
+    with TableFileWriter(path, headers, column_types) as writer:
+        for start in range(0, model.rowCount(), chunk_size):
+            end = min(start + chunk_size, model.rowCount())
+            # Columnar models slice whole columns instead of answering per cell
+            rows = list(zip(*(column_values(model, col, start, end) for col in range(columns))))
+            writer.append_rows(rows)
+    return path
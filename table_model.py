@@ -0,0 +1,347 @@
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from operator import itemgetter
+import sys
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+
+# Python type -> array typecode for numeric columns. Anything else is kept
+# in a plain list of (interned) strings.
+_TYPECODES = {int: "q", float: "d"}
+
+
+def column_values(model, col, start=0, end=None):
+    """
+    Copy of a column's values for rows start .. end - 1. Models exposing a
+    flat column (ColumnarTableModel, numeric MmapTableModel columns) are
+    sliced, anything else is read cell by cell through data().
+    """
+    end = model.rowCount() if end is None else end
+    if hasattr(model, "column"):
+        try:
+            values = model.column(col)[start:end]
+        except TypeError:
+            # e.g. string columns of a table file have no flat view
+            pass
+        else:
+            if isinstance(values, memoryview):
+                # Slices of a mapped column still point into the file
+                with values, values.cast("B") as raw:
+                    copy = array(values.format)
+                    copy.frombytes(raw)
+                return copy
+            return values
+    return [model.data(model.index(row, col)) for row in range(start, end)]
+
+
+def column_snapshot(model, col):
+    """Copy of a column's values that a worker thread can read safely."""
+    return column_values(model, col)
+
+
+def row_runs(positions):
+    """Group ascending positions into (start, count) runs of consecutive values."""
+    runs = []
+    for position in positions:
+        if runs and runs[-1][0] + runs[-1][1] == position:
+            runs[-1][1] += 1
+        else:
+            runs.append([position, 1])
+    return [tuple(run) for run in runs]
+
+
+def _longest_increasing(values):
+    """Indexes of one longest strictly increasing subsequence of values."""
+    tails = []      # tails[k]: index of the smallest tail of a run of length k + 1
+    previous = [-1] * len(values)
+    tail_values = []
+    for i, value in enumerate(values):
+        k = bisect_left(tail_values, value)
+        if k:
+            previous[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+    result = []
+    i = tails[-1] if tails else -1
+    while i >= 0:
+        result.append(i)
+        i = previous[i]
+    return result[::-1]
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    Table model that keeps each column in its own contiguous storage.
+    Numeric columns live in typed arrays, text columns in lists of strings,
+    and cells are only turned into display values when the view asks.
+
+    cellsAboutToChange(first, last) is emitted before rows are overwritten in
+    place, so listeners can still read the old values; dataChanged follows.
+    """
+
+    cellsAboutToChange = pyqtSignal(int, int)
+
+    def __init__(self, headers=None, column_count=3, column_types=None, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers) if headers else []
+        count = len(self._headers) if headers else column_count
+
+        # column_types may be a list or a {header: type} dict
+        if isinstance(column_types, dict):
+            names = self._headers or [str(i + 1) for i in range(count)]
+            column_types = [column_types.get(name, str) for name in names]
+        self._types = list(column_types) if column_types else [str] * count
+
+        self._columns = [self._new_column(t) for t in self._types]
+        self._row_count = 0
+
+    # Storage helpers
+    def _new_column(self, column_type, values=()):
+        typecode = _TYPECODES.get(column_type)
+        if typecode:
+            return array(typecode, values)
+        return list(values)
+
+    def _convert(self, col, value, strict=False):
+        column_type = self._types[col]
+        if value is None or value == "":
+            return column_type()
+        if column_type is str:
+            return sys.intern(str(value))
+        try:
+            if column_type is int and isinstance(value, str) and "." in value:
+                return int(float(value))
+            return column_type(value)
+        except (TypeError, ValueError):
+            # Bulk loads keep going with the column default, edits are rejected
+            if strict:
+                raise
+            return column_type()
+
+    def _convert_column(self, col, values):
+        column_type = self._types[col]
+        if column_type is str:
+            intern = sys.intern
+            return [intern(v) if type(v) is str else intern("" if v is None else str(v))
+                    for v in values]
+        try:
+            # Fast path: the whole column converts cleanly in one go
+            return self._new_column(column_type, map(column_type, values))
+        except (TypeError, ValueError):
+            return self._new_column(column_type, [self._convert(col, v) for v in values])
+
+    def _normalize_rows(self, rows):
+        if hasattr(rows, "tolist"):
+            # NumPy (record) arrays
+            rows = rows.tolist()
+        width = len(self._columns)
+        normalized = []
+        for row in rows:
+            row = tuple(row)
+            if len(row) != width:
+                row = (row + (None,) * width)[:width]
+            normalized.append(row)
+        return normalized
+
+    def _convert_row(self, values):
+        values = list(values)[:len(self._columns)]
+        values += [None] * (len(self._columns) - len(values))
+        return [self._convert(col, value) for col, value in enumerate(values)]
+
+    # Public API
+    def column(self, col):
+        """Raw storage of a column (array for numeric columns, list for text)."""
+        return self._columns[col]
+
+    def column_type(self, col):
+        return self._types[col]
+
+    def row_values(self, row):
+        return [column[row] for column in self._columns]
+
+    def append_row(self, values):
+        row = self._row_count
+        converted = self._convert_row(values)
+        self.beginInsertRows(QModelIndex(), row, row)
+        for column, value in zip(self._columns, converted):
+            column.append(value)
+        self._row_count += 1
+        self.endInsertRows()
+
+    def append_rows(self, rows):
+        """Append a batch of rows with a single insert notification."""
+        rows = self._normalize_rows(rows)
+        if not rows:
+            return 0
+        # Transpose once and convert column by column
+        converted = [self._convert_column(col, values)
+                     for col, values in enumerate(zip(*rows))]
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for column, values in zip(self._columns, converted):
+            column.extend(values)
+        self._row_count += len(rows)
+        self.endInsertRows()
+        return len(rows)
+
+    def extend_from_iterable(self, rows, chunk_size=10000):
+        """Consume a (possibly lazy) iterable, inserting one batch per chunk."""
+        rows = iter(rows)
+        total = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return total
+            total += self.append_rows(chunk)
+
+    def replace_rows(self, rows, key=0):
+        """
+        Replace the contents with rows, matching old and new rows by key and
+        emitting only the removals, insertions and dataChanged ranges needed.
+
+        key is a column index, a header name or a callable taking a row of
+        converted values. Rows whose relative order is unchanged stay in place;
+        rows that moved are removed and re-inserted.
+        """
+        rows = self._normalize_rows(rows)
+        width = len(self._columns)
+        if rows:
+            new_columns = [self._convert_column(col, values) for col, values in enumerate(zip(*rows))]
+        else:
+            new_columns = [self._new_column(t) for t in self._types]
+        new_rows = list(zip(*new_columns)) if width else []
+        old_rows = list(zip(*self._columns)) if width else []
+
+        key_of = self._key_function(key)
+        new_keys = [key_of(row) for row in new_rows]
+        new_position = {row_key: position for position, row_key in enumerate(new_keys)}
+        if len(new_position) != len(new_keys):
+            raise ValueError("replace_rows() needs unique keys")
+
+        # Old rows that survive, in old order, and the longest run of them that
+        # is already in new order
+        lookup = new_position.get
+        survivors = [(old, new) for old, new in enumerate(map(lookup, map(key_of, old_rows)))
+                     if new is not None]
+        targets = [new for _, new in survivors]
+        if all(a < b for a, b in zip(targets, targets[1:])):
+            # Common case: nothing moved
+            kept = {old for old, _ in survivors}
+        else:
+            kept = {survivors[i][0] for i in _longest_increasing(targets)}
+        kept_new = {new for old, new in survivors if old in kept}
+
+        # Removals, bottom up so earlier positions stay valid
+        removed = [old for old in range(len(old_rows)) if old not in kept]
+        for start, count in reversed(row_runs(removed)):
+            self.removeRows(start, count)
+
+        # Insertions, top down; every row above position is already final
+        inserted = [new for new in range(len(new_rows)) if new not in kept_new]
+        for start, count in row_runs(inserted):
+            self.beginInsertRows(QModelIndex(), start, start + count - 1)
+            for column, values in zip(self._columns, new_columns):
+                column[start:start] = values[start:start + count]
+            self._row_count += count
+            self.endInsertRows()
+
+        # In-place updates of kept rows whose values differ
+        changed = [new for old, new in survivors if old in kept and old_rows[old] != new_rows[new]]
+        for start, count in row_runs(changed):
+            self.cellsAboutToChange.emit(start, start + count - 1)
+            for column, values in zip(self._columns, new_columns):
+                column[start:start + count] = values[start:start + count]
+            self.dataChanged.emit(self.index(start, 0), self.index(start + count - 1, width - 1),
+                                  [Qt.DisplayRole, Qt.EditRole])
+
+        return {"inserted": len(inserted), "removed": len(removed), "changed": len(changed)}
+
+    def _key_function(self, key):
+        if callable(key):
+            return key
+        if isinstance(key, str):
+            key = self._headers.index(key)
+        return itemgetter(key)
+
+    def clear(self):
+        self.beginResetModel()
+        self._columns = [self._new_column(t) for t in self._types]
+        self._row_count = 0
+        self.endResetModel()
+
+    def nbytes(self):
+        """Approximate memory held by the column storage."""
+        total = 0
+        for column in self._columns:
+            if isinstance(column, array):
+                total += column.itemsize * len(column)
+            else:
+                total += sys.getsizeof(column)
+        return total
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._columns[index.column()][index.row()]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        try:
+            value = self._convert(index.column(), value, strict=True)
+        except (TypeError, ValueError):
+            return False
+        self.cellsAboutToChange.emit(index.row(), index.row())
+        self._columns[index.column()][index.row()] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return str(section + 1)
+
+    def setHorizontalHeaderLabels(self, headers):
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._columns) - 1)
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count < 1 or row < 0 or row > self._row_count:
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        for column, column_type in zip(self._columns, self._types):
+            column[row:row] = self._new_column(column_type, [column_type()] * count)
+        self._row_count += count
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count < 1 or row < 0 or row + count > self._row_count:
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        for column in self._columns:
+            del column[row:row + count]
+        self._row_count -= count
+        self.endRemoveRows()
+        return True
+
@@ -0,0 +1,265 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import sqlite3
+import threading
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class SqliteSource:
+    """
+    Read-only row source over a SQLite table or query.
+
+    Tables are paged by rowid (keyset pagination) so that page N does not cost
+    an OFFSET scan over the previous N pages. Arbitrary queries fall back to
+    LIMIT/OFFSET.
+    """
+
+    def __init__(self, path, table=None, query=None):
+        if (table is None) == (query is None):
+            raise ValueError("Pass exactly one of table or query")
+        self.path = path
+        self.table = table
+        self.query = query
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # start row -> rowid of the row just before it
+        self._page_keys = {0: None}
+
+        cursor = self._connection().execute(f"SELECT * FROM ({self._select()}) LIMIT 0")
+        self._columns = [description[0] for description in cursor.description]
+
+    def _connection(self):
+        # sqlite3 connections cannot be shared between threads
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path)
+            self._local.connection = connection
+        return connection
+
+    def _select(self):
+        return self.query if self.query else f'SELECT * FROM "{self.table}"'
+
+    def column_names(self):
+        return list(self._columns)
+
+    def row_count(self):
+        return self._connection().execute(f"SELECT COUNT(*) FROM ({self._select()})").fetchone()[0]
+
+    def fetch(self, start, count):
+        connection = self._connection()
+        if self.table is None:
+            return connection.execute(
+                f"{self._select()} LIMIT ? OFFSET ?", (count, start)
+            ).fetchall()
+
+        with self._lock:
+            known = start in self._page_keys
+            last_rowid = self._page_keys.get(start)
+        if known:
+            where = "" if last_rowid is None else "WHERE rowid > ?"
+            params = () if last_rowid is None else (last_rowid,)
+            rows = connection.execute(
+                f'SELECT rowid, * FROM "{self.table}" {where} ORDER BY rowid LIMIT ?',
+                params + (count,)
+            ).fetchall()
+        else:
+            rows = connection.execute(
+                f'SELECT rowid, * FROM "{self.table}" ORDER BY rowid LIMIT ? OFFSET ?',
+                (count, start)
+            ).fetchall()
+        if rows:
+            with self._lock:
+                self._page_keys[start + len(rows)] = rows[-1][0]
+        return [row[1:] for row in rows]
+
+
+class CsvSource:
+    """
+    Read-only row source over a delimited text file.
+
+    Byte offsets are recorded at every page boundary as the file is read, so
+    later fetches seek straight to their page. Fields containing embedded
+    newlines are not supported.
+    """
+
+    def __init__(self, path, delimiter=",", has_header=True, encoding="utf-8"):
+        self.path = path
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self._lock = threading.Lock()
+
+        with open(path, "rb") as handle:
+            first = handle.readline()
+            if has_header:
+                self._columns = self._parse([first])[0] if first else []
+                data_start = handle.tell()
+            else:
+                self._columns = [str(i + 1) for i in range(len(self._parse([first])[0]))] if first else []
+                data_start = 0
+
+        # Sorted start rows and their byte offsets
+        self._index_rows = [0]
+        self._index_offsets = [data_start]
+
+    def _parse(self, lines):
+        decoded = (line.decode(self.encoding) for line in lines)
+        return [tuple(row) for row in csv.reader(decoded, delimiter=self.delimiter)]
+
+    def _remember(self, row, offset):
+        position = bisect_right(self._index_rows, row)
+        if position and self._index_rows[position - 1] == row:
+            return
+        self._index_rows.insert(position, row)
+        self._index_offsets.insert(position, offset)
+
+    def column_names(self):
+        return list(self._columns)
+
+    def row_count(self):
+        # Unknown until the file has been read to the end
+        return None
+
+    def fetch(self, start, count):
+        with self._lock:
+            position = bisect_right(self._index_rows, start) - 1
+            row, offset = self._index_rows[position], self._index_offsets[position]
+
+        lines = []
+        with open(self.path, "rb") as handle:
+            handle.seek(offset)
+            # Skip forward from the nearest known boundary
+            while row < start:
+                line = handle.readline()
+                if not line:
+                    break
+                if line.strip():
+                    row += 1
+            while len(lines) < count:
+                line = handle.readline()
+                if not line:
+                    break
+                if line.strip():
+                    lines.append(line)
+            end_offset = handle.tell()
+
+        if row == start:
+            with self._lock:
+                self._remember(start + len(lines), end_offset)
+        return self._parse(lines)
+
+
+class PagedTableModel(QAbstractTableModel):
+    """
+    Read-only model that exposes a row source page by page.
+
+    The view grows the model through canFetchMore()/fetchMore(). Pages are kept
+    in an LRU cache and the pages after the one being viewed are prefetched on
+    a worker thread.
+    """
+
+    def __init__(self, source, page_size=1000, cache_pages=32, prefetch_pages=2, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.page_size = page_size
+        self.cache_pages = cache_pages
+        self.prefetch_pages = prefetch_pages
+
+        self._headers = source.column_names()
+        self._total = source.row_count()
+        self._loaded = 0
+        self._exhausted = self._total == 0
+
+        self._pages = OrderedDict()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # Page cache
+    def _store(self, page, rows):
+        with self._lock:
+            self._pages[page] = rows
+            self._pages.move_to_end(page)
+            self._pending.discard(page)
+            while len(self._pages) > self.cache_pages:
+                self._pages.popitem(last=False)
+
+    def _load(self, page):
+        rows = self.source.fetch(page * self.page_size, self.page_size)
+        self._store(page, rows)
+        return rows
+
+    def _page(self, page):
+        with self._lock:
+            rows = self._pages.get(page)
+            if rows is not None:
+                self._pages.move_to_end(page)
+                self.cache_hits += 1
+        if rows is None:
+            self.cache_misses += 1
+            rows = self._load(page)
+        self._prefetch(page + 1)
+        return rows
+
+    def _prefetch(self, first_page):
+        last_row = self._total if self._total is not None else self._loaded + self.page_size
+        with self._lock:
+            for page in range(first_page, first_page + self.prefetch_pages):
+                if page * self.page_size >= last_row:
+                    break
+                if page in self._pages or page in self._pending:
+                    continue
+                self._pending.add(page)
+                self._executor.submit(self._load, page)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # Lazy population
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        if self._total is not None:
+            count = min(self.page_size, self._total - self._loaded)
+        else:
+            # Unknown length: read the next page now to learn its size
+            count = len(self._page(self._loaded // self.page_size))
+        if count <= 0:
+            self._exhausted = True
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+        if count < self.page_size or self._loaded == self._total:
+            self._exhausted = True
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        page, offset = divmod(index.row(), self.page_size)
+        rows = self._page(page)
+        if offset >= len(rows) or index.column() >= len(rows[offset]):
+            return None
+        return rows[offset][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return str(section + 1)
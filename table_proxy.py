@@ -0,0 +1,437 @@
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, compress
+import threading
+
+from PyQt5.QtCore import (
+    Qt, QAbstractProxyModel, QModelIndex, QTimer, pyqtSignal
+)
+
+from table_model import column_snapshot, row_runs
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class AsyncSortFilterProxy(QAbstractProxyModel):
+    """
+    Sort/filter proxy that builds its row mapping on a worker thread.
+
+    Sort keys are read straight from the source's column storage when it has
+    one (ColumnarTableModel, MmapTableModel), so numeric columns compare as
+    numbers. Each sort/filter request bumps a generation counter; results of
+    an older generation are discarded and a running job stops at its next
+    checkpoint. Finished mappings are swapped in on the GUI thread in one
+    layout change, keeping the selection.
+    """
+
+    _finished = pyqtSignal(int, object, object)
+    _failed = pyqtSignal(int, str)
+    sortFinished = pyqtSignal()
+    sortFailed = pyqtSignal(str)
+
+    def __init__(self, parent=None, resort_delay=150):
+        super().__init__(parent)
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+        self.filter_text = ""
+        self.filter_column = None
+
+        # proxy row -> source row, and source row -> proxy row (-1 if filtered out)
+        self._rows = array("q")
+        self._proxy_rows = array("q")
+
+        self._bulk_removal = False
+        self._generation = 0
+        self._job_pending = False   # a scheduled job has not reported back yet
+        self._resort_after_removal = False
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._finished.connect(self._apply)
+        self._failed.connect(self._on_failed)
+
+        # Throttle re-sorts while rows are streaming in: at most one per
+        # resort_delay, and never while the previous job is still running
+        self._resort_queued = False
+        self._resort_timer = QTimer(self)
+        self._resort_timer.setSingleShot(True)
+        self._resort_timer.setInterval(resort_delay)
+        self._resort_timer.timeout.connect(self._resort_due)
+
+    # Public API
+    def is_active(self):
+        return self.sort_column >= 0 or bool(self.filter_text)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        self._schedule()
+
+    def set_filter(self, text, column=None):
+        """Keep rows containing text (case-insensitive), in one column or any column."""
+        self.filter_text = text or ""
+        self.filter_column = column
+        self._schedule()
+
+    def source_rows(self, start, count):
+        """Source rows behind proxy rows start .. start + count - 1."""
+        return self._rows[start:start + count]
+
+    def can_remove_rows(self):
+        """False for read-only sources (paged, memory-mapped), whose removeRows() refuses."""
+        model = self.sourceModel()
+        return model is not None and bool(model.flags(model.index(0, 0)) & Qt.ItemIsEditable)
+
+    def remove_rows(self, runs):
+        """
+        Remove the source rows behind (start, count) proxy runs. The view sees
+        one removal per proxy run and the source one removeRows() per run of
+        source rows, whatever the current ordering. Returns False, leaving
+        everything untouched, when the source is read-only.
+        """
+        model = self.sourceModel()
+        source_rows = sorted(chain.from_iterable(self.source_rows(start, count) for start, count in runs))
+        if not source_rows or not self.can_remove_rows():
+            return False
+        # A running job maps the old rows, so it is dropped and run again below
+        resort = self._job_pending
+        self.cancel()
+        self._bulk_removal = True
+        try:
+            for start, count in reversed(runs):
+                self.beginRemoveRows(QModelIndex(), start, start + count - 1)
+                del self._rows[start:start + count]
+                self.endRemoveRows()
+            for start, count in reversed(row_runs(source_rows)):
+                model.removeRows(start, count)
+        finally:
+            self._bulk_removal = False
+
+        # One remapping pass for all removed runs
+        if self.is_active():
+            self._rows = array("q", (row - bisect_left(source_rows, row) for row in self._rows))
+            self._proxy_rows = self._inverse(self._rows, model.rowCount())
+            if resort:
+                self._schedule()
+        else:
+            self._set_identity()
+        return True
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+        self._job_pending = False
+        self._resort_queued = False
+
+    def close(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # Source model
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            for signal, slot in self._source_connections(old):
+                signal.disconnect(slot)
+        self.cancel()
+        self.beginResetModel()
+        super().setSourceModel(model)
+        self._set_identity()
+        self.endResetModel()
+        if model is not None:
+            for signal, slot in self._source_connections(model):
+                signal.connect(slot)
+        if self.is_active():
+            self._schedule()
+
+    def _source_connections(self, model):
+        return [
+            (model.rowsInserted, self._source_rows_inserted),
+            (model.rowsAboutToBeRemoved, self._source_rows_about_to_be_removed),
+            (model.rowsRemoved, self._source_rows_removed),
+            (model.modelAboutToBeReset, self._source_about_to_reset),
+            (model.modelReset, self._source_reset),
+            (model.layoutAboutToBeChanged, self._source_about_to_reset),
+            (model.layoutChanged, self._source_reset),
+            (model.dataChanged, self._source_data_changed),
+            (model.headerDataChanged, self.headerDataChanged),
+        ]
+
+    def _set_identity(self):
+        count = self.sourceModel().rowCount() if self.sourceModel() is not None else 0
+        self._rows = array("q", range(count))
+        self._proxy_rows = array("q", range(count))
+
+    def _source_rows_inserted(self, parent, first, last):
+        count = last - first + 1
+        if not self.is_active():
+            # Identity mapping: forward the insert as is
+            self.beginInsertRows(QModelIndex(), first, last)
+            if first == len(self._rows):
+                self._rows.extend(range(first, last + 1))
+                self._proxy_rows.extend(range(first, last + 1))
+            else:
+                self._set_identity()
+            self.endInsertRows()
+            return
+
+        middle = first != len(self._proxy_rows)
+        if middle:
+            # Rows below the insert point move down in the source
+            self.cancel()
+            self._rows = array("q", (row + count if row >= first else row for row in self._rows))
+
+        # New rows go to the end until the next sort lands
+        new_rows = range(first, last + 1)
+        if self.filter_text:
+            matches = self._matcher()
+            keep = [row for row in new_rows if matches(self._row_texts(row))]
+        else:
+            keep = list(new_rows)
+        if keep:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(keep) - 1)
+            self._rows.extend(keep)
+            self._update_inverse(middle, keep, start)
+            self.endInsertRows()
+        else:
+            self._update_inverse(middle, keep, len(self._rows))
+        if self.sort_column >= 0 or middle:
+            self._request_resort()
+
+    def _update_inverse(self, rebuild, appended, start):
+        if rebuild:
+            self._proxy_rows = self._inverse(self._rows, self.sourceModel().rowCount())
+            return
+        self._proxy_rows.extend([-1] * (self.sourceModel().rowCount() - len(self._proxy_rows)))
+        for offset, row in enumerate(appended):
+            self._proxy_rows[row] = start + offset
+
+    def _source_about_to_reset(self, *args):
+        self.cancel()
+        self.beginResetModel()
+
+    def _source_rows_about_to_be_removed(self, parent, first, last):
+        if self._bulk_removal:
+            return
+        # A running job maps the old rows; _source_rows_removed runs it again
+        self._resort_after_removal = self._job_pending
+        self.cancel()
+        # Remove the proxy rows of the doomed source rows, one contiguous run at a time
+        proxy_rows = sorted(row for row in self._proxy_rows[first:last + 1] if row >= 0)
+        for start, count in reversed(row_runs(proxy_rows)):
+            self.beginRemoveRows(QModelIndex(), start, start + count - 1)
+            del self._rows[start:start + count]
+            self.endRemoveRows()
+
+    def _source_rows_removed(self, parent, first, last):
+        if self._bulk_removal:
+            return
+        resort, self._resort_after_removal = self._resort_after_removal, False
+        # Shift the source rows after the removed range, proxy order is preserved
+        if not self.is_active():
+            self._set_identity()
+            return
+        count = last - first + 1
+        self._rows = array("q", (row - count if row > last else row for row in self._rows))
+        self._proxy_rows = self._inverse(self._rows, self.sourceModel().rowCount())
+        if resort:
+            # Through the timer, so a diff removing many runs sorts once
+            self._request_resort()
+
+    def _source_reset(self, *args):
+        self._set_identity()
+        self.endResetModel()
+        if self.is_active():
+            self._schedule()
+
+    def _source_data_changed(self, top_left, bottom_right, roles=()):
+        roles = list(roles)
+        left, right = top_left.column(), bottom_right.column()
+        if not self.is_active():
+            self.dataChanged.emit(self.index(top_left.row(), left), self.index(bottom_right.row(), right), roles)
+        else:
+            # Re-emit per run of proxy rows the changed source rows landed on
+            proxy_rows = sorted(row for row in self._proxy_rows[top_left.row():bottom_right.row() + 1]
+                                if row >= 0)
+            for start, count in row_runs(proxy_rows):
+                self.dataChanged.emit(self.index(start, left), self.index(start + count - 1, right), roles)
+        touched = range(top_left.column(), bottom_right.column() + 1)
+        if self.sort_column in touched or (self.filter_text and
+                                           (self.filter_column is None or self.filter_column in touched)):
+            self._request_resort()
+
+    # Background job
+    def _column_snapshot(self, col):
+        return column_snapshot(self.sourceModel(), col)
+
+    def _row_texts(self, row):
+        model = self.sourceModel()
+        columns = range(model.columnCount()) if self.filter_column is None else (self.filter_column,)
+        return [model.data(model.index(row, col)) for col in columns]
+
+    def _matcher(self):
+        needle = self.filter_text.casefold()
+        return lambda values: any(needle in str(value).casefold() for value in values)
+
+    def _request_resort(self):
+        # Not restarted while active, so a steady stream cannot postpone it forever
+        if not self._resort_timer.isActive():
+            self._resort_timer.start()
+
+    def _resort_due(self):
+        if self._job_pending:
+            # Replacing it now would throw its work away; run once it lands
+            self._resort_queued = True
+        else:
+            self._schedule()
+
+    def _schedule(self):
+        self._resort_timer.stop()
+        self._resort_queued = False
+        model = self.sourceModel()
+        if model is None:
+            return
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        self._job_pending = True
+
+        count = model.rowCount()
+        sort_keys = self._column_snapshot(self.sort_column) if self.sort_column >= 0 else None
+        filter_columns = []
+        if self.filter_text:
+            columns = range(model.columnCount()) if self.filter_column is None else (self.filter_column,)
+            filter_columns = [self._column_snapshot(col) for col in columns]
+
+        self._executor.submit(self._build, generation, count, sort_keys,
+                              self.sort_order, filter_columns, self.filter_text)
+
+    def _check(self, generation):
+        if generation != self._generation:
+            raise _Cancelled()
+
+    @staticmethod
+    def _sorted(rows, sort_keys, reverse):
+        if isinstance(sort_keys, array):
+            return sorted(rows, key=sort_keys.__getitem__, reverse=reverse)
+        # Cells read through data() may be None (e.g. SQL NULL), which sorts
+        # after every value; mixed types fall back to comparing as text
+        try:
+            return sorted(rows, key=lambda row: (sort_keys[row] is None, sort_keys[row]),
+                          reverse=reverse)
+        except TypeError:
+            return sorted(rows, key=lambda row: (sort_keys[row] is None, str(sort_keys[row])),
+                          reverse=reverse)
+
+    def _build(self, generation, count, sort_keys, order, filter_columns, filter_text):
+        try:
+            rows = range(count)
+            if sort_keys is not None:
+                self._check(generation)
+                rows = self._sorted(rows, sort_keys, order == Qt.DescendingOrder)
+            if filter_columns:
+                self._check(generation)
+                needle = filter_text.casefold()
+                mask = [False] * count
+                for column in filter_columns:
+                    self._check(generation)
+                    for row, value in enumerate(column):
+                        if not mask[row] and needle in str(value).casefold():
+                            mask[row] = True
+                rows = compress(rows, (mask[row] for row in rows)) if sort_keys is None \
+                    else [row for row in rows if mask[row]]
+            rows = array("q", rows)
+            self._check(generation)
+            inverse = self._inverse(rows, count)
+            self._check(generation)
+        except _Cancelled:
+            return
+        except Exception as e:
+            # The executor would swallow it and the view would wait forever
+            self._failed.emit(generation, f"{type(e).__name__}: {e}")
+            return
+        self._finished.emit(generation, rows, inverse)
+
+    @staticmethod
+    def _inverse(rows, count):
+        inverse = array("q", [-1]) * count
+        for proxy_row, source_row in enumerate(rows):
+            inverse[source_row] = proxy_row
+        return inverse
+
+    def _apply(self, generation, rows, inverse):
+        if generation != self._generation:
+            return
+        self._job_pending = False
+        if self._resort_queued:
+            self._resort_queued = False
+            self._request_resort()
+        # Rows appended while the job ran keep their place at the end
+        job_count = len(inverse)
+        if len(self._proxy_rows) > job_count:
+            tail = [row for row in self._rows if row >= job_count]
+            inverse.extend([-1] * (len(self._proxy_rows) - job_count))
+            for offset, row in enumerate(tail):
+                inverse[row] = len(rows) + offset
+            rows.extend(tail)
+        if len(rows) != len(self._rows):
+            self.beginResetModel()
+            self._rows, self._proxy_rows = rows, inverse
+            self.endResetModel()
+        else:
+            self.layoutAboutToBeChanged.emit()
+            old = self.persistentIndexList()
+            new = []
+            for index in old:
+                proxy_row = inverse[self._rows[index.row()]]
+                new.append(self.index(proxy_row, index.column()) if proxy_row >= 0 else QModelIndex())
+            self._rows, self._proxy_rows = rows, inverse
+            self.changePersistentIndexList(old, new)
+            self.layoutChanged.emit()
+        self.sortFinished.emit()
+
+    def _on_failed(self, generation, error):
+        if generation == self._generation:
+            self._job_pending = False
+            self._resort_queued = False
+            self.sortFailed.emit(error)
+
+    # Qt proxy interface
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid() or source_index.row() >= len(self._proxy_rows):
+            return QModelIndex()
+        proxy_row = self._proxy_rows[source_index.row()]
+        if proxy_row < 0:
+            return QModelIndex()
+        return self.index(proxy_row, source_index.column())
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._rows)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        if index is None:
+            # QObject.parent()
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        model = self.sourceModel()
+        return 0 if parent.isValid() or model is None else model.columnCount()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and self.sourceModel() is not None:
+            return self.sourceModel().headerData(section, orientation, role)
+        return str(section + 1) if role == Qt.DisplayRole else None
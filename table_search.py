@@ -0,0 +1,260 @@
+from array import array
+from bisect import bisect_left, insort
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+import re
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from table_model import column_snapshot
+
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(value):
+    return _WORD.findall(str(value).casefold())
+
+
+class TableSearchIndex(QObject):
+    """
+    Inverted word index over every cell of a table model, for find-as-you-type.
+
+    Each query word matches cell words starting with it ("lon" finds "London"),
+    and a row matches when all query words do. Rows carry stable ids that
+    increase with their position, so positions are recovered by bisecting the
+    id array and deleting rows never rewrites the postings; deleted ids are
+    tombstoned and dropped at the next rebuild.
+
+    The index is built on a worker thread the first time search() is called.
+    After that it follows appends, deletes and edits incrementally; large
+    batches and structural changes schedule a background rebuild. search()
+    returns None while a build is running and ready is emitted when it lands.
+    """
+
+    ready = pyqtSignal()
+    _built = pyqtSignal(int, object, object)
+
+    def __init__(self, model=None, inline_limit=10000, parent=None):
+        super().__init__(parent)
+        self.inline_limit = inline_limit
+        self.model = None
+
+        self._postings = {}        # word -> array of row ids
+        self._vocabulary = []      # sorted words, for prefix lookups
+        self._row_ids = array("q")  # row position -> id (ascending)
+        self._next_id = 0
+        self._deleted = set()
+        self._edited = set()
+
+        self._state = "empty"      # empty | building | ready
+        self._build_count = 0      # rows the running build snapshotted
+        self._pending = 0          # rows appended since, added when it lands
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._built.connect(self._apply_build)
+
+        if model is not None:
+            self.set_model(model)
+
+    # Public API
+    def set_model(self, model):
+        if self.model is not None:
+            for signal, slot in self._model_connections(self.model):
+                signal.disconnect(slot)
+        self.model = model
+        for signal, slot in self._model_connections(model):
+            signal.connect(slot)
+        self._invalidate()
+        self._state = "empty"
+
+    def is_ready(self):
+        return self._state == "ready"
+
+    def search(self, text, limit=None):
+        """Sorted row positions matching text, or None while the index builds."""
+        if self._state != "ready":
+            if self._state == "empty":
+                self.rebuild()
+            return None
+        words = tokenize(text)
+        if not words:
+            return []
+
+        # Start from the most selective word; the others are only probed
+        # against the candidate set, never turned into sets of their own
+        postings = sorted((self._postings_with_prefix(word) for word in set(words)),
+                          key=lambda arrays: sum(map(len, arrays)))
+        matches = set(chain.from_iterable(postings[0]))
+        for arrays in postings[1:]:
+            if not matches:
+                return []
+            matches = matches.intersection(chain.from_iterable(arrays))
+        matches -= self._deleted
+        if self._edited:
+            matches = {row_id for row_id in matches
+                       if row_id not in self._edited or self._row_matches(row_id, words)}
+
+        # Ids ascend with positions, so sorting and truncating the ids first
+        # leaves only the rows returned to be located
+        row_ids = sorted(matches)
+        if limit is not None:
+            row_ids = row_ids[:limit]
+        if not self._deleted:
+            # Nothing deleted since the last build: ids are positions
+            return row_ids
+        return [bisect_left(self._row_ids, row_id) for row_id in row_ids]
+
+    def rebuild(self):
+        """Rebuild the whole index on the worker thread."""
+        model = self.model
+        if model is None:
+            return
+        generation = self._invalidate()
+        self._state = "building"
+        self._build_count = model.rowCount()
+        self._pending = 0
+        columns = [column_snapshot(model, col) for col in range(model.columnCount())]
+        self._executor.submit(self._build, generation, columns, model.rowCount())
+
+    def stats(self):
+        return {
+            "state": self._state,
+            "rows": len(self._row_ids),
+            "words": len(self._postings),
+            "deleted": len(self._deleted),
+        }
+
+    def close(self):
+        self._invalidate()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # Building
+    def _invalidate(self):
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def _build(self, generation, columns, count):
+        postings = {}
+        for column in columns:
+            for row_id, value in enumerate(column):
+                for word in set(tokenize(value)):
+                    ids = postings.get(word)
+                    if ids is None:
+                        ids = postings[word] = array("q")
+                    ids.append(row_id)
+            if generation != self._generation:
+                return
+        self._built.emit(generation, postings, count)
+
+    def _apply_build(self, generation, postings, count):
+        if generation != self._generation:
+            return
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+        self._row_ids = array("q", range(count))
+        self._next_id = count
+        self._deleted = set()
+        self._edited = set()
+        self._state = "ready"
+        if self._pending:
+            self._add_rows(count, count + self._pending - 1)
+            self._pending = 0
+        self.ready.emit()
+
+    def _add_rows(self, first, last):
+        model = self.model
+        columns = range(model.columnCount())
+        for row in range(first, last + 1):
+            row_id = self._next_id
+            self._next_id += 1
+            self._row_ids.append(row_id)
+            self._add_words(row_id, self._row_words(row, columns))
+
+    def _add_words(self, row_id, words):
+        for word in words:
+            ids = self._postings.get(word)
+            if ids is None:
+                ids = self._postings[word] = array("q")
+                insort(self._vocabulary, word)
+            ids.append(row_id)
+
+    def _row_words(self, row, columns):
+        model = self.model
+        words = set()
+        for col in columns:
+            words.update(tokenize(model.data(model.index(row, col))))
+        return words
+
+    def _row_matches(self, row_id, words):
+        row = bisect_left(self._row_ids, row_id)
+        row_words = self._row_words(row, range(self.model.columnCount()))
+        return all(any(w.startswith(word) for w in row_words) for word in words)
+
+    def _postings_with_prefix(self, prefix):
+        vocabulary = self._vocabulary
+        arrays = []
+        position = bisect_left(vocabulary, prefix)
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            arrays.append(self._postings[vocabulary[position]])
+            position += 1
+        return arrays
+
+    # Model tracking
+    def _model_connections(self, model):
+        return [
+            (model.rowsInserted, self._rows_inserted),
+            (model.rowsAboutToBeRemoved, self._rows_about_to_be_removed),
+            (model.rowsRemoved, self._rows_removed),
+            (model.dataChanged, self._data_changed),
+            (model.modelReset, self._structure_changed),
+            (model.layoutChanged, self._structure_changed),
+        ]
+
+    def _rows_inserted(self, parent, first, last):
+        if self._state == "empty":
+            return
+        if self._state == "building":
+            if first == self._build_count + self._pending:
+                # Appends while building (e.g. a streaming ingest draining every
+                # frame) wait for the build instead of restarting it
+                self._pending += last - first + 1
+            else:
+                self.rebuild()
+            return
+        if first == len(self._row_ids) and last - first < self.inline_limit:
+            self._add_rows(first, last)
+        else:
+            self.rebuild()
+
+    def _rows_about_to_be_removed(self, parent, first, last):
+        if self._state != "ready":
+            return
+        self._deleted.update(self._row_ids[first:last + 1])
+        del self._row_ids[first:last + 1]
+        # Compact once tombstones outweigh live rows
+        if len(self._deleted) > max(len(self._row_ids), 1000):
+            self.rebuild()
+
+    def _rows_removed(self, *args):
+        if self._state == "building":
+            # The running build saw the rows before removal
+            self.rebuild()
+
+    def _data_changed(self, top_left, bottom_right, roles=()):
+        if self._state == "building":
+            self.rebuild()
+        if self._state != "ready":
+            return
+        columns = range(self.model.columnCount())
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            row_id = self._row_ids[row]
+            self._edited.add(row_id)
+            self._add_words(row_id, self._row_words(row, columns))
+
+    def _structure_changed(self, *args):
+        if self._state != "empty":
+            self.rebuild()
@@ -1,128 +1,303 @@
 import sys
-from PyQt5.QtCore import Qt, QPoint, QPropertyAnimation, pyqtProperty
-from PyQt5.QtGui import QColor, QPainter, QFont, QIcon
+from collections import OrderedDict
+from PyQt5.QtCore import (
+    Qt, QPoint, QRect, QEvent, QElapsedTimer, QVariantAnimation, QModelIndex
+)
+from PyQt5.QtGui import (
+    QColor, QPainter, QFont, QIcon, QPen, QBrush, QFontMetrics, QStaticText, QTransform, QRegion,
+    QPalette
+)
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QTableView, QStyledItemDelegate,
-    QHeaderView, QAbstractItemView, QStyle, QHBoxLayout
+    QHeaderView, QAbstractItemView, QStyle, QHBoxLayout, QFrame
 )
-from PyQt5.QtGui import QStandardItemModel, QStandardItem
+
+from table_model import ColumnarTableModel
+from table_ingest import StreamingIngest
+from table_paging import PagedTableModel
+from table_mmap import MmapTableModel, model_to_table
+from table_proxy import AsyncSortFilterProxy
+from table_search import TableSearchIndex
+from table_csv import CsvImportJob, CsvExportJob
+from table_footer import AggregateTracker, AggregateFooter
+from table_autosize import ColumnAutoSizer
 
 
 class RippleEffect(QWidget):
-    def __init__(self, parent=None):
+    """
+    Click ripples drawn over a parent widget (the table viewport).
+
+    Ripples live in a fixed-size pool and are all driven by a single looping
+    animation that only runs while at least one ripple is active. Each frame
+    repaints only the bounding rects of the active ripples.
+    """
+
+    def __init__(self, parent=None, pool_size=4, duration=400, max_radius=80,
+                 color=QColor(33, 150, 243), max_opacity=150):
         super().__init__(parent)
-        self._radius = 0
-        self._opacity = 0
-        self._pos = QPoint(0, 0)
+        self.duration = duration
+        self.max_radius = max_radius
+        self.max_opacity = max_opacity
+        self._color = QColor(color)
+
+        # Pool slots: [center, started_ms, radius, opacity]; opacity 0 = free
+        self._pool = [[QPoint(0, 0), 0, 0, 0] for _ in range(pool_size)]
+        self._clock = QElapsedTimer()
+        self._clock.start()
+
+        self._animation = QVariantAnimation(self)
+        self._animation.setStartValue(0.0)
+        self._animation.setEndValue(1.0)
+        self._animation.setDuration(duration)
+        self._animation.setLoopCount(-1)
+        self._animation.valueChanged.connect(self._advance)
+
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        if parent is not None:
+            self.setGeometry(parent.rect())
+            parent.installEventFilter(self)
         self.raise_()
 
     def start(self, pos):
-        self._pos = pos
-        self._radius = 0
-        self._opacity = 150
-
-        anim = QPropertyAnimation(self, b"radius")
-        anim.setDuration(400)
-        anim.setStartValue(0)
-        anim.setEndValue(80)
-        anim.start()
-
-        anim2 = QPropertyAnimation(self, b"opacity")
-        anim2.setDuration(400)
-        anim2.setStartValue(150)
-        anim2.setEndValue(0)
-        anim2.start()
-
-    def paintEvent(self, event):
-        if self._opacity > 0:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            color = QColor(33, 150, 243)
-            color.setAlpha(self._opacity)
-            painter.setBrush(color)
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(self._pos, self._radius, self._radius)
-
-    def getRadius(self):
-        return self._radius
-
-    def setRadius(self, value):
-        self._radius = value
-        self.update()
-
-    def getOpacity(self):
-        return self._opacity
+        # QAbstractScrollArea scrolls the viewport with QWidget::scroll(), which
+        # moves child widgets along with the content
+        if self.parent() is not None and self.geometry() != self.parent().rect():
+            self.setGeometry(self.parent().rect())
+
+        # Reuse a free slot, or recycle the oldest ripple
+        slot = min(self._pool, key=lambda ripple: (ripple[3] > 0, ripple[1]))
+        if slot[3] > 0:
+            self.update(self._bounds(slot))
+        slot[0] = QPoint(pos)
+        slot[1] = self._clock.elapsed()
+        slot[2] = 0
+        slot[3] = self.max_opacity
+        if self._animation.state() != QVariantAnimation.Running:
+            self._animation.start()
+
+    def active_count(self):
+        return sum(1 for ripple in self._pool if ripple[3] > 0)
+
+    def _bounds(self, ripple):
+        r = ripple[2] + 1
+        return QRect(ripple[0].x() - r, ripple[0].y() - r, 2 * r + 1, 2 * r + 1)
+
+    def _advance(self, _value=None):
+        now = self._clock.elapsed()
+        dirty = QRegion()
+        for ripple in self._pool:
+            if ripple[3] <= 0:
+                continue
+            dirty += self._bounds(ripple)
+            progress = min(1.0, (now - ripple[1]) / self.duration)
+            ripple[2] = int(self.max_radius * progress)
+            ripple[3] = int(self.max_opacity * (1.0 - progress))
+            dirty += self._bounds(ripple)
+        if dirty.isEmpty():
+            self._animation.stop()
+        else:
+            self.update(dirty)
 
-    def setOpacity(self, value):
-        self._opacity = value
-        self.update()
+    def eventFilter(self, watched, event):
+        if watched is self.parent():
+            if event.type() == QEvent.Resize:
+                self.setGeometry(watched.rect())
+            elif event.type() == QEvent.MouseButtonPress:
+                self.start(event.pos())
+        return False
 
-    radius = pyqtProperty(int, fget=getRadius, fset=setRadius)
-    opacity = pyqtProperty(int, fget=getOpacity, fset=setOpacity)
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        color = QColor(self._color)
+        for center, _, radius, opacity in self._pool:
+            if opacity > 0 and event.rect().intersects(self._bounds((center, 0, radius))):
+                color.setAlpha(opacity)
+                painter.setBrush(color)
+                painter.drawEllipse(center, radius, radius)
+
+
+class MaterialTheme:
+    """
+    Everything one theme needs (palette, pens, brushes, font), built once and
+    shared. Switching themes swaps references instead of rebuilding anything.
+    """
+
+    COLORS = {
+        # background, text, hover, selection
+        "dark": ("#121212", "#FFFFFF", (255, 255, 255, 20), (33, 150, 243, 80)),
+        "light": ("#FFFFFF", "#000000", (0, 0, 0, 10), (33, 150, 243, 60)),
+    }
+    _cache = {}
+
+    def __init__(self, name):
+        background, text, hover, select = self.COLORS.get(name, self.COLORS["light"])
+        self.name = name
+        self.text_pen = QPen(QColor(text))
+        self.hover_brush = QBrush(QColor(*hover))
+        self.select_brush = QBrush(QColor(*select))
+        self.font = QFont("Segoe UI", 10)
+        self.metrics = QFontMetrics(self.font)
+
+        # Applied with setPalette() instead of a stylesheet, so switching does
+        # not re-polish the widget tree
+        self.palette = QPalette()
+        for role in (QPalette.Base, QPalette.Window, QPalette.Button):
+            self.palette.setColor(role, QColor(background))
+        for role in (QPalette.Text, QPalette.WindowText, QPalette.ButtonText):
+            self.palette.setColor(role, QColor(text))
+
+    @classmethod
+    def get(cls, name):
+        theme = cls._cache.get(name)
+        if theme is None:
+            theme = cls._cache[name] = cls(name)
+        return theme
 
 
 class MaterialDelegate(QStyledItemDelegate):
-    def __init__(self, theme, parent=None):
+    def __init__(self, theme, parent=None, text_cache_size=4096):
         super().__init__(parent)
+        self.set_theme(theme)
+
+        # (text, width, theme) -> prepared QStaticText of the elided text
+        self.text_cache_size = text_cache_size
+        self._text_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.painted_cells = 0
+
+    def set_theme(self, theme):
+        # Cached text stays valid, its key includes the theme name
         self.theme = theme
+        self.resources = MaterialTheme.get(theme)
+
+    def cache_stats(self):
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._text_cache)}
+
+    def _static_text(self, text, width):
+        key = (text, width, self.theme)
+        static = self._text_cache.get(key)
+        if static is not None:
+            self._text_cache.move_to_end(key)
+            self.cache_hits += 1
+            return static
+
+        self.cache_misses += 1
+        metrics = self.resources.metrics
+        static = QStaticText(metrics.elidedText(text, Qt.ElideRight, width))
+        static.setTextFormat(Qt.PlainText)
+        static.prepare(QTransform(), self.resources.font)
+        self._text_cache[key] = static
+        if len(self._text_cache) > self.text_cache_size:
+            self._text_cache.popitem(last=False)
+        return static
+
+    def _is_hovered(self, option, index):
+        # MaterialTableView tracks the hovered row itself
+        hover_row = getattr(option.widget, "hover_row", None)
+        if hover_row is not None:
+            return index.row() == hover_row
+        return bool(option.state & QStyle.State_MouseOver)
 
     def paint(self, painter, option, index):
+        self.painted_cells += 1
         painter.save()
         rect = option.rect
-
-        # Colors based on theme
-        if self.theme == "dark":
-            text_color = QColor("#FFFFFF")
-            hover_color = QColor(255, 255, 255, 20)
-            select_color = QColor(33, 150, 243, 80)
-        else:
-            text_color = QColor("#000000")
-            hover_color = QColor(0, 0, 0, 10)
-            select_color = QColor(33, 150, 243, 60)
+        resources = self.resources
 
         # Background effects
         if option.state & QStyle.State_Selected:
             painter.setRenderHint(QPainter.Antialiasing)
-            painter.setBrush(select_color)
+            painter.setBrush(resources.select_brush)
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 8, 8)
-        elif option.state & QStyle.State_MouseOver:
+        elif self._is_hovered(option, index):
             painter.setRenderHint(QPainter.Antialiasing)
-            painter.setBrush(hover_color)
+            painter.setBrush(resources.hover_brush)
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 8, 8)
 
         # Text
-        painter.setPen(text_color)
-        painter.setFont(QFont("Segoe UI", 10))
-        text = str(index.data())
-        painter.drawText(rect.adjusted(10, 0, -10, 0), Qt.AlignVCenter | Qt.AlignLeft, text)
+        value = index.data()
+        text = value if type(value) is str else str(value)
+        static = self._static_text(text, rect.width() - 20)
+        painter.setPen(resources.text_pen)
+        painter.setFont(resources.font)
+        y = rect.top() + (rect.height() - resources.metrics.height()) // 2
+        painter.drawStaticText(rect.left() + 10, y, static)
 
         painter.restore()
 
 
+class MaterialTableView(QTableView):
+    """
+    QTableView that tracks the hovered row itself and repaints only the rows
+    entering and leaving hover, instead of relying on Qt's per-cell hover.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hover_row = -1
+        self.painted_cells = 0   # cells painted in the last frame
+        self.viewport().setAttribute(Qt.WA_Hover, False)
+
+    def set_hover_row(self, row):
+        if row == self.hover_row:
+            return
+        old, self.hover_row = self.hover_row, row
+        self.update_row(old)
+        self.update_row(row)
+
+    def update_row(self, row):
+        """Invalidate just the visible rect of one row."""
+        if row < 0:
+            return
+        y = self.rowViewportPosition(row)
+        height = self.rowHeight(row)
+        if y + height >= 0 and y <= self.viewport().height():
+            self.viewport().update(0, y, self.viewport().width(), height)
+
+    def mouseMoveEvent(self, event):
+        self.set_hover_row(self.rowAt(event.pos().y()))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self.set_hover_row(-1)
+        super().leaveEvent(event)
+
+    def wheelEvent(self, event):
+        super().wheelEvent(event)
+        # Content moved under a still cursor
+        self.set_hover_row(self.rowAt(event.pos().y()))
+
+    def paintEvent(self, event):
+        delegate = self.itemDelegate()
+        before = getattr(delegate, "painted_cells", 0)
+        super().paintEvent(event)
+        self.painted_cells = getattr(delegate, "painted_cells", 0) - before
+
+
 class MaterialTableWidget(QWidget):
-    def __init__(self, theme="light", headers=None, parent=None):
+    def __init__(self, theme="light", headers=None, column_types=None, parent=None):
         super().__init__(parent)
         self.theme = theme
         self.current_theme = theme
         self.setLayout(QVBoxLayout())
 
         # Table
-        self.table = QTableView()
+        self.table = MaterialTableView()
         self.table.setMouseTracking(True)
         self.table.setShowGrid(False)
         self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.table.setItemDelegate(MaterialDelegate(self.theme, self.table))
-
-        if self.theme == "dark":
-            self.table.setStyleSheet("background-color: #121212; border: none; color: white;")
-        else:
-            self.table.setStyleSheet("background-color: #FFFFFF; border: none; color: black;")
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.setFrameShape(QFrame.NoFrame)
+        self.delegate = MaterialDelegate(self.theme, self.table)
+        self.table.setItemDelegate(self.delegate)
+        self.table.setPalette(MaterialTheme.get(self.theme).palette)
 
         self.layout().addWidget(self.table)
 
@@ -130,10 +305,28 @@ class MaterialTableWidget(QWidget):
         self.ripple = RippleEffect(self.table.viewport())
 
         # Model
-        self.model = QStandardItemModel(0, len(headers) if headers else 3)
-        if headers:
-            self.model.setHorizontalHeaderLabels(headers)
-        self.table.setModel(self.model)
+        self.model = ColumnarTableModel(headers, column_types=column_types)
+        self._local_model = self.model
+
+        # Sorting/filtering runs in the proxy, the view only ever sees the proxy
+        self.proxy = AsyncSortFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.table.setModel(self.proxy)
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
+
+        # Full-text index, built on the first find_rows() call
+        self.search_index = TableSearchIndex(self.model, parent=self)
+
+        # Streaming ingest, created on demand by start_ingest()
+        self.ingest = None
+
+        # Sampling column auto-size, created on demand by auto_size_columns()
+        self.autosizer = None
+
+        # Aggregate footer, created on demand by set_footer_visible()
+        self.aggregates = None
+        self.footer = None
 
         # Floating delete button
         self.delete_btn = QPushButton("X", self.table.viewport())
@@ -157,25 +350,96 @@ class MaterialTableWidget(QWidget):
     def get_model(self):
         return self.model
 
+    def can_add_rows(self):
+        """False while a read-only source (paged, memory-mapped) is shown."""
+        return hasattr(self.model, "append_rows")
+
     def add_row(self, row_data=None):
         if row_data is None:
             row_data = ["New", "Data", "Row"]
-        row = self.model.rowCount()
-        self.model.insertRow(row)
-        for col, value in enumerate(row_data):
-            self.model.setItem(row, col, QStandardItem(value))
+        if self.can_add_rows():
+            self.model.append_row(row_data)
+
+    def add_rows(self, rows):
+        """
+        Insert many rows (lists, tuples or a NumPy record array) in one batch.
+        Returns the number of rows added, 0 for a read-only source.
+        """
+        if not self.can_add_rows():
+            return 0
+        return self.model.append_rows(rows)
+
+    def extend_from_generator(self, rows, chunk_size=10000):
+        """Insert rows from a lazy generator, one batch per chunk_size rows."""
+        if not self.can_add_rows():
+            return 0
+        return self.model.extend_from_iterable(rows, chunk_size)
+
+    def replace_data(self, rows, key=0):
+        """
+        Swap in a refreshed snapshot, touching only rows that were added,
+        removed or changed (matched by key). Selection and scroll position
+        survive. Returns None, leaving a read-only source untouched.
+        """
+        if not self.can_add_rows():
+            return None
+        return self.model.replace_rows(rows, key)
+
+    def import_csv(self, path, has_header=True, chunk_size=20000, use_header=False):
+        """
+        Append a CSV file in the background; connect to the job's progress/finished.
+        The table keeps its headers unless use_header takes them from the file.
+        Returns None without starting anything while a read-only source is shown.
+        """
+        if not self.can_add_rows():
+            return None
+        return self._start_csv_job(CsvImportJob(self.model, path, has_header, chunk_size=chunk_size,
+                                                 use_header=use_header))
+
+    def export_csv(self, path, chunk_size=20000):
+        """Write the table to a CSV file in the background."""
+        return self._start_csv_job(CsvExportJob(self.model, path, chunk_size=chunk_size))
+
+    def start_ingest(self, max_batch=5000, capacity=100000, policy="drop_oldest"):
+        """
+        Start draining rows pushed from worker threads, one batch per frame.
+        Returns None without starting anything while a read-only source is shown.
+        """
+        if not self.can_add_rows():
+            return None
+        if self.ingest is not None:
+            self.ingest.stop()
+        self.ingest = StreamingIngest(self.model, max_batch, capacity, policy, parent=self)
+        self.ingest.start()
+        return self.ingest
+
+    def stop_ingest(self):
+        if self.ingest is not None:
+            self.ingest.stop()
+
+    def selected_row_ranges(self):
+        """Selected view rows as sorted, merged (start, count) runs."""
+        spans = sorted((r.top(), r.bottom()) for r in self.table.selectionModel().selection())
+        runs = []
+        for top, bottom in spans:
+            if runs and top <= runs[-1][1] + 1:
+                runs[-1][1] = max(runs[-1][1], bottom)
+            else:
+                runs.append([top, bottom])
+        return [(top, bottom - top + 1) for top, bottom in runs]
 
     def delete_selected_row(self):
-        selected = self.table.selectionModel().selectedRows()
-        if selected:
-            row = selected[0].row()
-            self.model.removeRow(row)
+        """Delete every selected row, one removeRows() call per contiguous run."""
+        runs = self.selected_row_ranges()
+        if runs and self.proxy.can_remove_rows():
+            row = runs[0][0]
+            self.proxy.remove_rows(runs)
 
             # Select next row if exists
-            if row < self.model.rowCount():
-                new_index = self.model.index(row, 0)
-            elif self.model.rowCount() > 0:
-                new_index = self.model.index(self.model.rowCount() - 1, 0)
+            if row < self.proxy.rowCount():
+                new_index = self.proxy.index(row, 0)
+            elif self.proxy.rowCount() > 0:
+                new_index = self.proxy.index(self.proxy.rowCount() - 1, 0)
             else:
                 new_index = None
 
@@ -187,24 +451,119 @@ class MaterialTableWidget(QWidget):
         else:
             self.delete_btn.hide()
 
+    def sort_by(self, column, order=Qt.AscendingOrder):
+        """Sort in the background; column -1 restores insertion order."""
+        self.table.sortByColumn(column, order)
+
+    def set_filter(self, text, column=None):
+        self.proxy.set_filter(text, column)
+
+    def find_rows(self, text, limit=None):
+        """
+        Model rows whose cells contain words starting with each word of text.
+        Returns None while the index is being built; search_index.ready fires
+        when it can answer.
+        """
+        return self.search_index.search(text, limit)
+
+    def auto_size_columns(self, sample_size=1000, max_width=480, keep_refining=True):
+        """
+        Fit columns to a sample of the rows plus the visible window instead of
+        measuring every row. With keep_refining, columns keep growing to fit
+        rows as they scroll into view or arrive.
+        """
+        if self.autosizer is None:
+            self.autosizer = ColumnAutoSizer(self.table, MaterialTheme.get(self.current_theme).font,
+                                             parent=self)
+        self.autosizer.sample_size = sample_size
+        self.autosizer.max_width = max_width
+        if keep_refining:
+            self.autosizer.set_enabled(True)
+        else:
+            self.autosizer.set_enabled(False)
+            self.autosizer.fit()
+        return self.autosizer
+
+    def set_footer_visible(self, visible=True):
+        """Show a footer row with per-column count/sum/min/max/mean/distinct."""
+        if visible and self.footer is None:
+            self.aggregates = AggregateTracker(self.model, self)
+            self.footer = AggregateFooter(self.table, self.aggregates)
+            self.layout().insertWidget(self.layout().indexOf(self.table) + 1, self.footer)
+        if self.footer is not None:
+            self.footer.setVisible(visible)
+
+    def column_aggregates(self, column):
+        """Current aggregates of a column as a dict, or None without a footer."""
+        if self.aggregates is None:
+            return None
+        return self.aggregates.stats[column].as_dict()
+
+    def attach_source(self, source, page_size=1000, cache_pages=32, prefetch_pages=2):
+        """Show a SqliteSource/CsvSource lazily instead of the in-memory rows."""
+        self._set_model(PagedTableModel(source, page_size, cache_pages, prefetch_pages, self))
+        return self.model
+
+    def detach_source(self):
+        """Go back to the in-memory model."""
+        self._set_model(self._local_model)
+
+    def open_table_file(self, path):
+        """Show a memory-mapped table file (see table_mmap) without loading it."""
+        self._set_model(MmapTableModel(path, self))
+        return self.model
+
+    def save_table_file(self, path):
+        return model_to_table(self.model, path)
+
     def switch_theme(self, theme=None):
         if theme:
             self.current_theme = theme
         else:
             self.current_theme = "light" if self.current_theme == "dark" else "dark"
 
-        self.table.setItemDelegate(MaterialDelegate(self.current_theme, self.table))
-        if self.current_theme == "dark":
-            self.table.setStyleSheet("background-color: #121212; border: none; color: white;")
-        else:
-            self.table.setStyleSheet("background-color: #FFFFFF; border: none; color: black;")
+        # Swap the precompiled theme in by reference, then one repaint of
+        # the visible area
+        self.delegate.set_theme(self.current_theme)
+        self.table.setPalette(MaterialTheme.get(self.current_theme).palette)
+        if self.autosizer is not None:
+            self.autosizer.set_font(MaterialTheme.get(self.current_theme).font)
         self.table.viewport().update()
 
     # Internal Methods
+    def _start_csv_job(self, job):
+        # Keep the job alive until it reports back
+        job.setParent(self)
+        job.finished.connect(job.deleteLater)
+        job.failed.connect(job.deleteLater)
+        return job.start()
+
+    def _set_model(self, model):
+        old = self.model
+        self.model = model
+        self.proxy.setSourceModel(model)
+        self.search_index.set_model(model)
+        if self.aggregates is not None:
+            self.aggregates.set_model(model)
+        self.delete_btn.hide()
+        if old is not self._local_model and old is not model:
+            # Paged and memory-mapped models hold threads/file handles. Close
+            # them only once nothing listens to them any more: their closing
+            # reset would make the proxy, index and footer read a closed file.
+            old.close()
+
     def show_delete_button(self):
-        selected = self.table.selectionModel().selectedRows()
-        if selected:
-            index = selected[0]
+        # Anchor on the current row if it is selected, else the first selected run,
+        # without expanding a large selection into individual indexes
+        selection = self.table.selectionModel()
+        current = self.table.currentIndex()
+        if current.isValid() and selection.isRowSelected(current.row(), QModelIndex()):
+            row = current.row()
+        else:
+            runs = self.selected_row_ranges()
+            row = runs[0][0] if runs else None
+        if row is not None and self.proxy.can_remove_rows():
+            index = self.proxy.index(row, 0)
             rect = self.table.visualRect(index)
             x = rect.right() - 30
             y = rect.top() + (rect.height() - 24) // 2
@@ -220,7 +579,9 @@ if __name__ == "__main__":
     layout = QVBoxLayout(window)
 
     # Create material table widget
-    table_widget = MaterialTableWidget(theme="light", headers=["Name", "Age", "City"])
+    table_widget = MaterialTableWidget(
+        theme="light", headers=["Name", "Age", "City"], column_types={"Age": int}
+    )
     layout.addWidget(table_widget)
 
     # Buttons
@@ -232,8 +593,8 @@ if __name__ == "__main__":
     layout.addLayout(btn_layout)
 
     # Sample Data
-    for row in [["Alice", "24", "New York"], ["Bob", "30", "London"], ["Charlie", "28", "Paris"]]:
-        table_widget.add_row(row)
+    table_widget.add_rows([["Alice", "24", "New York"], ["Bob", "30", "London"], ["Charlie", "28", "Paris"]])
+    table_widget.set_footer_visible(True)
 
     # Connect buttons
     add_btn.clicked.connect(lambda: table_widget.add_row(["User", "20", "City"]))